@@ -0,0 +1,182 @@
+from collections import defaultdict
+
+from pydantic import BaseModel
+
+from .DataRelease import DataRelease
+from .DataReleaseComponent import DataReleaseComponentSystem
+from .DataReleaseInitiation import DataReleaseInitiation
+from .Dataset import RelatedIdentifierTypeEnum
+from .Entity import ENTITY_FIELDS, ENTITY_LIST_FIELDS
+
+DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/", "doi:")
+
+
+class Violation(BaseModel):
+    """A record that breaks a referential-integrity rule.
+
+    Fields
+    ------
+    rule: The name of the rule that was broken.
+    usgsIdentifier: Identifier of the record that breaks the rule.
+    path: Location of the offending value within the record.
+    message: A description of the violation.
+    """
+
+    rule: str
+    usgsIdentifier: str
+    path: str
+    message: str
+
+
+class IntegrityReport(BaseModel):
+    """Violations found in a catalog, grouped by rule.
+
+    Fields
+    ------
+    checked: Number of records checked.
+    violations: The violations of each rule that was broken.
+    """
+
+    checked: int = 0
+    violations: dict[str, list[Violation]] = {}
+
+    @property
+    def ok(self):
+        return not self.violations
+
+    def add(self, rule, usgsIdentifier, path, message):
+        self.violations.setdefault(rule, []).append(
+            Violation(rule=rule, usgsIdentifier=usgsIdentifier, path=path, message=message)
+        )
+
+
+def normalize_identifier(value):
+    """Normalize a DOI or URL so that equivalent forms compare equal."""
+    value = str(value).strip()
+    lowered = value.lower()
+    for prefix in DOI_PREFIXES:
+        if lowered.startswith(prefix):
+            return "doi:" + lowered[len(prefix):]
+    if lowered.startswith("10."):
+        return "doi:" + lowered
+    return lowered.rstrip("/")
+
+
+def entities(record):
+    """Yield (path, entity) for every Entity, Creator, and Contributor in a record."""
+    for name in ENTITY_FIELDS:
+        entity = getattr(record, name, None)
+        if entity is not None:
+            yield name, entity
+    for name in ENTITY_LIST_FIELDS:
+        for i, entity in enumerate(getattr(record, name, None) or ()):
+            yield f"{name}[{i}]", entity
+    for i, distribution in enumerate(getattr(record, "distribution", None) or ()):
+        if distribution.modifiedBy is not None:
+            yield f"distribution[{i}].modifiedBy", distribution.modifiedBy
+
+
+class CatalogIntegrityChecker:
+    """Check referential integrity across an entire catalog.
+
+    Indexes of the catalog are built in a single pass and each rule is then
+    checked as a set join over those indexes. Violations are reported by
+    usgsIdentifier, so only system-level records (e.g., DataRelease,
+    DataReleaseComponent, DataReleaseInitiation) are accepted; check() raises
+    TypeError for a record without one, such as a DataReleaseComponentForm.
+
+    isPartOf: A DataReleaseComponent's isPartOf names an existing DataRelease
+        (by usgsIdentifier or identifier, in any form normalize_identifier
+        accepts).
+    relatedIdentifier: DOI and URL related identifiers resolve to a record in
+        the catalog or to one of known_identifiers.
+    creatorPosition: Creator positions are unique and contiguous from
+        first_position.
+    entityId: Every occurrence of an entity_id has the same name and
+        nameIdentifier.
+    """
+
+    rules = ("isPartOf", "relatedIdentifier", "creatorPosition", "entityId")
+
+    def __init__(self, known_identifiers=(), first_position=1, rules=None):
+        self.known_identifiers = {normalize_identifier(i) for i in known_identifiers}
+        self.first_position = first_position
+        if rules is not None:
+            self.rules = tuple(rules)
+
+    def check(self, records):
+        """Check records and return an IntegrityReport."""
+        report = IntegrityReport()
+        releases = set()
+        identifiers = set(self.known_identifiers)
+        parents = defaultdict(list)
+        references = defaultdict(list)
+        entity_names = defaultdict(lambda: defaultdict(list))
+
+        for record in records:
+            rid = getattr(record, "usgsIdentifier", None)
+            if rid is None:
+                raise TypeError(f"Cannot check a {type(record).__name__} record without a usgsIdentifier")
+            report.checked += 1
+            identifiers.add(normalize_identifier(rid))
+            if record.identifier is not None:
+                identifiers.add(normalize_identifier(record.identifier))
+
+            if isinstance(record, (DataRelease, DataReleaseInitiation)):
+                releases.add(normalize_identifier(rid))
+                if record.identifier is not None:
+                    releases.add(normalize_identifier(record.identifier))
+            if isinstance(record, DataReleaseComponentSystem):
+                parents[normalize_identifier(record.isPartOf)].append((rid, record.isPartOf))
+
+            for i, relation in enumerate(getattr(record, "relation", None) or ()):
+                if relation.relatedIdentifierType in (RelatedIdentifierTypeEnum.DOI, RelatedIdentifierTypeEnum.URL):
+                    references[normalize_identifier(relation.relatedIdentifier)].append(
+                        (rid, f"relation[{i}].relatedIdentifier", relation.relatedIdentifier)
+                    )
+
+            if "creatorPosition" in self.rules:
+                self._check_positions(record, report)
+
+            for path, entity in entities(record):
+                if entity.entity_id is not None:
+                    entity_names[entity.entity_id][(entity.name, entity.nameIdentifier)].append((rid, path))
+
+        if "isPartOf" in self.rules:
+            for parent in parents.keys() - releases:
+                for rid, value in parents[parent]:
+                    report.add("isPartOf", rid, "isPartOf", f"No DataRelease with identifier {value!r}")
+
+        if "relatedIdentifier" in self.rules:
+            for reference in references.keys() - identifiers:
+                for rid, path, value in references[reference]:
+                    report.add("relatedIdentifier", rid, path, f"{value!r} does not resolve to a known record")
+
+        if "entityId" in self.rules:
+            for entity_id, names in entity_names.items():
+                if len(names) > 1:
+                    variants = ", ".join(sorted(repr(name) for name, _ in names))
+                    for occurrences in names.values():
+                        for rid, path in occurrences:
+                            report.add(
+                                "entityId",
+                                rid,
+                                f"{path}.entity_id",
+                                f"entity_id {entity_id!r} is used for different entities: {variants}",
+                            )
+        return report
+
+    def _check_positions(self, record, report):
+        positions = [creator.position for creator in getattr(record, "creator", None) or ()]
+        if not positions:
+            return
+        expected = range(self.first_position, self.first_position + len(positions))
+        if len(set(positions)) != len(positions):
+            report.add("creatorPosition", record.usgsIdentifier, "creator", f"Duplicate creator positions: {positions}")
+        elif sorted(positions) != list(expected):
+            report.add(
+                "creatorPosition",
+                record.usgsIdentifier,
+                "creator",
+                f"Creator positions {sorted(positions)} are not contiguous from {self.first_position}",
+            )
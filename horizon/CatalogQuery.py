@@ -0,0 +1,320 @@
+import bisect
+import math
+from collections import defaultdict
+from datetime import datetime, time, timezone
+from enum import Enum
+
+from pydantic import BaseModel
+
+from .Location import bbox_bounds
+
+# Size, in degrees, of the grid cells used to index bounding boxes
+GRID_SIZE = 10
+
+
+def _bitmap(rows, size):
+    """Build an integer bitmap with the bit of every row in rows set."""
+    bits = bytearray(size // 8 + 1)
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _rows(bitmap):
+    """The rows whose bits are set in bitmap, in ascending order."""
+    rows = []
+    for i, byte in enumerate(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")):
+        while byte:
+            low = byte & -byte
+            rows.append(i * 8 + low.bit_length() - 1)
+            byte ^= low
+    return rows
+
+
+def _key(value):
+    return value.value if isinstance(value, Enum) else value
+
+
+def _normalize_time(value, as_date):
+    if value is None:
+        return None
+    if as_date:
+        return value.date() if isinstance(value, datetime) else value
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _longitude_ranges(west, east):
+    """Split a longitude range crossing the antimeridian (west > east) in two."""
+    if west <= east:
+        return [(west, east)]
+    return [(west, 180.0), (-180.0, east)]
+
+
+def _grid_cells(bounds):
+    west, south, east, north = bounds
+    rows = range(math.floor(max(south, -90) / GRID_SIZE), math.floor(min(north, 90) / GRID_SIZE) + 1)
+    for low, high in _longitude_ranges(west, east):
+        for x in range(math.floor(max(low, -180) / GRID_SIZE), math.floor(min(high, 180) / GRID_SIZE) + 1):
+            for y in rows:
+                yield (x, y)
+
+
+class Predicate:
+    """A condition on catalog records. Subclasses implement matches()."""
+
+    def matches(self, record):
+        raise NotImplementedError
+
+
+class Eq(Predicate):
+    """field == value. Served by a bitmap index for enum fields."""
+
+    def __init__(self, field, value):
+        self.field = field
+        self.value = _key(value)
+
+    def matches(self, record):
+        return _key(getattr(record, self.field, None)) == self.value
+
+    def __repr__(self):
+        return f"Eq({self.field!r}, {self.value!r})"
+
+
+class Range(Predicate):
+    """start <= field < end. Either bound may be omitted. Served by a sorted index for date fields."""
+
+    def __init__(self, field, start=None, end=None):
+        self.field = field
+        self.start = start
+        self.end = end
+
+    def matches(self, record):
+        value = getattr(record, self.field, None)
+        if value is None:
+            return False
+        as_date = not isinstance(value, datetime)
+        value = _normalize_time(value, as_date)
+        start, end = _normalize_time(self.start, as_date), _normalize_time(self.end, as_date)
+        return (start is None or value >= start) and (end is None or value < end)
+
+    def __repr__(self):
+        return f"Range({self.field!r}, {self.start!r}, {self.end!r})"
+
+
+class HasKeyword(Predicate):
+    """The record has a keyword with the given concept (case-insensitive) and, optionally, conceptScheme."""
+
+    def __init__(self, concept, conceptScheme=None):
+        self.concept = concept.casefold()
+        self.conceptScheme = conceptScheme
+
+    def matches(self, record):
+        return any(
+            keyword.concept.casefold() == self.concept
+            and (self.conceptScheme is None or keyword.conceptScheme == self.conceptScheme)
+            for keyword in getattr(record, "keyword", None) or ()
+        )
+
+    def __repr__(self):
+        return f"HasKeyword({self.concept!r}, {self.conceptScheme!r})"
+
+
+class Intersects(Predicate):
+    """The record's spatial.bbox intersects the given bounds. west > east crosses the antimeridian."""
+
+    def __init__(self, west, south, east, north):
+        self.bounds = (west, south, east, north)
+
+    def matches(self, record):
+        spatial = getattr(record, "spatial", None)
+        bounds = bbox_bounds(spatial.bbox if spatial is not None else None)
+        if bounds is None:
+            return False
+        west, south, east, north = self.bounds
+        if bounds[1] > north or bounds[3] < south:
+            return False
+        return any(
+            low <= other_high and other_low <= high
+            for low, high in _longitude_ranges(west, east)
+            for other_low, other_high in _longitude_ranges(bounds[0], bounds[2])
+        )
+
+    def __repr__(self):
+        return f"Intersects{self.bounds!r}"
+
+
+class Where(Predicate):
+    """An arbitrary condition, always evaluated against the records."""
+
+    def __init__(self, function):
+        self.function = function
+
+    def matches(self, record):
+        return bool(self.function(record))
+
+    def __repr__(self):
+        return f"Where({getattr(self.function, '__name__', self.function)!r})"
+
+
+class PlanStep(BaseModel):
+    """A step of a query plan.
+
+    Fields
+    ------
+    predicate: The condition applied by the step.
+    strategy: "index" if the condition is answered from an index, "scan" if
+        it is checked against the candidate records.
+    estimate: Estimated number of records matching the condition alone.
+    """
+
+    predicate: str
+    strategy: str
+    estimate: int
+
+
+class CatalogQuery:
+    """Query a catalog snapshot with indexes and a cost-based planner.
+
+    Bitmap indexes are kept over the enum fields, sorted indexes over the date
+    fields, and inverted indexes over keyword concepts and a grid of bounding
+    boxes. A query is a conjunction of predicates. The planner orders the
+    predicates by estimated selectivity, intersects index bitmaps while that is
+    cheaper than checking the remaining candidates directly, and only then
+    touches the records themselves.
+
+    Example
+    -------
+    query = CatalogQuery(releases)
+    query.filter(
+        Eq("status", StatusEnum.published),
+        Eq("usgsReleaseType", UsgsReleaseTypeEnum.dynamic),
+        Range("issued", start=date(2020, 1, 1)),
+        HasKeyword("streamflow"),
+    )
+    """
+
+    enum_fields = ("status", "usgsReleaseType", "usgsAssetType", "accessRights")
+    date_fields = ("issued", "modified", "usgsCreated", "usgsModified")
+
+    def __init__(self, records):
+        self.records = list(records)
+        size = len(self.records)
+        self._all = (1 << size) - 1
+
+        enum_rows = {field: defaultdict(list) for field in self.enum_fields}
+        date_rows = {field: [] for field in self.date_fields}
+        keyword_rows = defaultdict(list)
+        cell_rows = defaultdict(list)
+        for row, record in enumerate(self.records):
+            for field in self.enum_fields:
+                value = getattr(record, field, None)
+                if value is not None:
+                    enum_rows[field][_key(value)].append(row)
+            for field in self.date_fields:
+                value = getattr(record, field, None)
+                if value is not None:
+                    date_rows[field].append((_normalize_time(value, not isinstance(value, datetime)), row))
+            for concept in {keyword.concept.casefold() for keyword in getattr(record, "keyword", None) or ()}:
+                keyword_rows[concept].append(row)
+            spatial = getattr(record, "spatial", None)
+            bounds = bbox_bounds(spatial.bbox if spatial is not None else None)
+            if bounds is not None:
+                for cell in set(_grid_cells(bounds)):
+                    cell_rows[cell].append(row)
+
+        self._enums = {
+            field: {value: _bitmap(rows, size) for value, rows in values.items()}
+            for field, values in enum_rows.items()
+        }
+        self._dates = {}
+        for field, pairs in date_rows.items():
+            pairs.sort()
+            self._dates[field] = ([value for value, _ in pairs], [row for _, row in pairs])
+        self._keywords = dict(keyword_rows)
+        self._cells = dict(cell_rows)
+
+    def __len__(self):
+        return len(self.records)
+
+    def _estimate(self, predicate):
+        """Return (estimate, index lookup) for a predicate, or (len, None) if no index applies."""
+        if isinstance(predicate, Eq) and predicate.field in self._enums:
+            bitmap = self._enums[predicate.field].get(predicate.value, 0)
+            return bitmap.bit_count(), lambda: bitmap
+        if isinstance(predicate, Range) and predicate.field in self._dates:
+            values, rows = self._dates[predicate.field]
+            as_date = bool(values) and not isinstance(values[0], datetime)
+            start = _normalize_time(predicate.start, as_date)
+            end = _normalize_time(predicate.end, as_date)
+            low = 0 if start is None else bisect.bisect_left(values, start)
+            high = len(values) if end is None else bisect.bisect_left(values, end)
+            high = max(low, high)
+            return high - low, lambda: _bitmap(rows[low:high], len(self))
+        if isinstance(predicate, HasKeyword):
+            rows = self._keywords.get(predicate.concept, [])
+            return len(rows), lambda: _bitmap(rows, len(self))
+        if isinstance(predicate, Intersects):
+            cells = set(_grid_cells(predicate.bounds))
+            cell_rows = [self._cells[cell] for cell in cells if cell in self._cells]
+            estimate = min(len(self), sum(len(rows) for rows in cell_rows))
+            return estimate, lambda: _bitmap((row for rows in cell_rows for row in rows), len(self))
+        return len(self), None
+
+    def _plan(self, predicates):
+        steps = sorted(
+            ((predicate, *self._estimate(predicate)) for predicate in predicates),
+            key=lambda step: (step[2] is None, step[1]),
+        )
+        plan = []
+        candidates = len(self)
+        for predicate, estimate, lookup in steps:
+            # A bitmap from an enum index is free to intersect. Other indexes
+            # cost about as much as the rows they return, so once fewer
+            # candidates remain it is cheaper to check them directly.
+            free = isinstance(predicate, Eq)
+            use_index = lookup is not None and (free or estimate < candidates)
+            plan.append((predicate, lookup if use_index else None, estimate))
+            if use_index:
+                candidates = min(candidates, estimate)
+        return plan
+
+    def explain(self, *predicates):
+        """Return the plan that filter() would follow, as a list of PlanStep."""
+        return [
+            PlanStep(predicate=repr(predicate), strategy="index" if lookup else "scan", estimate=estimate)
+            for predicate, lookup, estimate in self._plan(predicates)
+        ]
+
+    def _select(self, predicates):
+        plan = self._plan(predicates)
+        bitmap = self._all
+        residual = []
+        for predicate, lookup, _ in plan:
+            if lookup is None:
+                residual.append(predicate)
+                continue
+            bitmap &= lookup()
+            if not bitmap:
+                return []
+            # The bounding box grid and the keyword index (which ignores
+            # conceptScheme) only narrow the candidates
+            if isinstance(predicate, Intersects) or (
+                isinstance(predicate, HasKeyword) and predicate.conceptScheme is not None
+            ):
+                residual.append(predicate)
+        rows = _rows(bitmap)
+        if residual:
+            rows = [row for row in rows if all(p.matches(self.records[row]) for p in residual)]
+        return rows
+
+    def filter(self, *predicates):
+        """Return the records matching all predicates, in catalog order."""
+        return [self.records[row] for row in self._select(predicates)]
+
+    def count(self, *predicates):
+        """Return the number of records matching all predicates."""
+        return len(self._select(predicates))
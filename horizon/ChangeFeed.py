@@ -0,0 +1,194 @@
+import base64
+import bisect
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from .DataRelease import StatusEnum
+
+
+class ChangeFeedEntry(BaseModel):
+    """A change to a cataloged resource's record.
+
+    Fields
+    ------
+    usgsIdentifier: Identifier used to internally identify a resource within a
+        particular system
+    usgsModified: Date and time that the resource's record was last modified
+    status: The status of the record within the curation process, if the record
+        has one.
+    deleted: Indicates whether the entry is a tombstone. If true, the record
+        has been deprecated and mirrors should withdraw it.
+    """
+
+    usgsIdentifier: str
+    usgsModified: datetime
+    status: StatusEnum | None = None
+    deleted: bool = False
+
+
+class ChangeFeedPage(BaseModel):
+    """A page of changes returned from a change feed.
+
+    Fields
+    ------
+    entries: The changes after the requested cursor, ordered by usgsModified
+        and usgsIdentifier.
+    cursor: Opaque position of the last entry in the page. Pass it back to
+        retrieve the following page.
+    hasMore: Indicates whether more changes are available after this page.
+    """
+
+    entries: list[ChangeFeedEntry]
+    cursor: str | None = None
+    hasMore: bool = False
+
+
+def _utc(modified):
+    """Return modified as a naive UTC datetime. Naive datetimes are taken to be UTC."""
+    if modified.tzinfo is not None:
+        modified = modified.astimezone(timezone.utc).replace(tzinfo=None)
+    return modified
+
+
+def _sort_key(entry):
+    """Ordering key for an entry: (usgsModified as naive UTC, usgsIdentifier).
+
+    Naive datetimes are treated as UTC so that naive and aware timestamps can
+    be ordered together.
+    """
+    return (_utc(entry.usgsModified), entry.usgsIdentifier)
+
+
+def encode_cursor(key):
+    """Encode an ordering key as an opaque cursor string."""
+    raw = json.dumps([key[0].isoformat(), key[1]]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor):
+    """Decode a cursor produced by encode_cursor back into an ordering key."""
+    try:
+        modified, identifier = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return (_utc(datetime.fromisoformat(modified)), identifier)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid change feed cursor: {cursor!r}") from e
+
+
+class ChangeFeed:
+    """Watermark-based feed of record changes ordered by (usgsModified, usgsIdentifier).
+
+    The feed keeps a sorted index of the latest change for every record so
+    that polling for changes after a cursor costs a binary search plus the
+    size of the returned page, independent of the catalog size. Records whose
+    status is Deprecated are carried as tombstones.
+
+    When a path is given the index is persisted as an append-only JSON lines
+    log. The log is replayed on load (the newest entry for each record wins) and
+    can be rewritten with compact().
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path is not None else None
+        self._keys = []
+        self._entries = {}
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, usgsIdentifier):
+        return usgsIdentifier in self._entries
+
+    def _load(self):
+        with open(self.path) as f:
+            for line in f:
+                if line.strip():
+                    entry = ChangeFeedEntry.model_validate_json(line)
+                    previous = self._entries.get(entry.usgsIdentifier)
+                    if previous is None or _sort_key(entry) >= _sort_key(previous):
+                        self._entries[entry.usgsIdentifier] = entry
+        self._keys = sorted(_sort_key(e) for e in self._entries.values())
+
+    def _apply(self, entry):
+        """Index entry unless it is older than the indexed entry for the same record.
+
+        Stale entries (e.g., from replays or out-of-order batches) would move a
+        record behind cursors that mirrors already hold, so they are ignored.
+        Returns whether the entry was indexed.
+        """
+        previous = self._entries.get(entry.usgsIdentifier)
+        if previous is not None:
+            key = _sort_key(previous)
+            if _sort_key(entry) < key:
+                return False
+            i = bisect.bisect_left(self._keys, key)
+            if i < len(self._keys) and self._keys[i] == key:
+                del self._keys[i]
+        self._entries[entry.usgsIdentifier] = entry
+        bisect.insort(self._keys, _sort_key(entry))
+        return True
+
+    def record(self, record):
+        """Record a change to a single resource. See record_many."""
+        return self.record_many([record])[0]
+
+    def record_many(self, records):
+        """Record changes to resources and return their current feed entries.
+
+        Records may be any model with usgsIdentifier and usgsModified (e.g.,
+        Dataset, DataRelease, DataReleaseComponent). Records with a status of
+        Deprecated are recorded as tombstones. A record older than the feed's
+        entry for it is ignored, and the existing entry is returned. When the
+        feed is persisted, the batch is appended to the log with a single write.
+        """
+        entries = []
+        applied = []
+        for record in records:
+            status = getattr(record, "status", None)
+            status = StatusEnum(status) if status is not None else None
+            entry = ChangeFeedEntry(
+                usgsIdentifier=record.usgsIdentifier,
+                usgsModified=record.usgsModified,
+                status=status,
+                deleted=status is StatusEnum.deprecated,
+            )
+            if self._apply(entry):
+                applied.append(entry)
+            entries.append(self._entries[entry.usgsIdentifier])
+
+        if self.path is not None and applied:
+            with open(self.path, "a") as f:
+                f.write("".join(e.model_dump_json() + "\n" for e in applied))
+                f.flush()
+                os.fsync(f.fileno())
+        return entries
+
+    def changes(self, cursor=None, limit=100):
+        """Return the page of changes after cursor (or from the start of the feed)."""
+        start = 0
+        if cursor is not None:
+            start = bisect.bisect_right(self._keys, decode_cursor(cursor))
+        keys = self._keys[start : start + limit]
+        entries = [self._entries[identifier] for _, identifier in keys]
+        return ChangeFeedPage(
+            entries=entries,
+            cursor=encode_cursor(keys[-1]) if keys else cursor,
+            hasMore=start + len(keys) < len(self._keys),
+        )
+
+    def compact(self):
+        """Rewrite the persisted log so it holds only the latest entry per record."""
+        if self.path is None:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w") as f:
+            for _, identifier in self._keys:
+                f.write(self._entries[identifier].model_dump_json() + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
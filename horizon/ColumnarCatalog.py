@@ -0,0 +1,202 @@
+from array import array
+
+
+class _ScalarColumn:
+    """Dictionary-encoded column of JSON scalars. Each distinct value is stored once."""
+
+    def __init__(self, length=0):
+        self.values = []
+        self.codes = array("i", [-1] * length)
+        self._lookup = {}
+
+    def __len__(self):
+        return len(self.codes)
+
+    def append(self, value):
+        if value is None:
+            self.codes.append(-1)
+            return
+        key = (value.__class__, value)
+        code = self._lookup.get(key)
+        if code is None:
+            code = self._lookup[key] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def get(self, i):
+        code = self.codes[i]
+        return None if code < 0 else self.values[code]
+
+    def freeze(self):
+        self.values = tuple(self.values)
+        self._lookup = None
+
+
+class _StructColumn:
+    """Column of JSON objects stored as one child column per key."""
+
+    def __init__(self, length=0):
+        self.present = bytearray(length)
+        self.children = {}
+
+    def __len__(self):
+        return len(self.present)
+
+    def append(self, value):
+        if value is None:
+            self.present.append(0)
+            for child in self.children.values():
+                child.append(None)
+            return
+        length = len(self.present)
+        self.present.append(1)
+        for key, item in value.items():
+            child = self.children.get(key)
+            if child is None:
+                if item is None:
+                    continue
+                child = self.children[key] = _column_for(item, length)
+            child.append(item)
+        for key, child in self.children.items():
+            if len(child) == length:
+                child.append(None)
+
+    def get(self, i):
+        if not self.present[i]:
+            return None
+        return {key: child.get(i) for key, child in self.children.items()}
+
+    def freeze(self):
+        self.present = bytes(self.present)
+        for child in self.children.values():
+            child.freeze()
+
+
+class _ListColumn:
+    """Column of JSON arrays stored as offsets into a single child column of items."""
+
+    def __init__(self, length=0):
+        self.present = bytearray(length)
+        self.offsets = array("q", [0] * (length + 1))
+        self.items = None
+
+    def __len__(self):
+        return len(self.present)
+
+    def append(self, value):
+        self.present.append(value is not None)
+        for item in value or ():
+            if self.items is None:
+                self.items = _column_for(item, self.offsets[-1])
+            self.items.append(item)
+        self.offsets.append(self.offsets[-1] + len(value or ()))
+
+    def get(self, i):
+        if not self.present[i]:
+            return None
+        return [self.items.get(j) for j in range(self.offsets[i], self.offsets[i + 1])]
+
+    def freeze(self):
+        self.present = bytes(self.present)
+        if self.items is not None:
+            self.items.freeze()
+
+
+def _column_for(value, length):
+    """Create an empty column for the kind of value, padded with length missing rows."""
+    if isinstance(value, dict):
+        return _StructColumn(length)
+    if isinstance(value, list):
+        return _ListColumn(length)
+    return _ScalarColumn(length)
+
+
+class ColumnarCatalog:
+    """Compact, read-only catalog of records of one model, stored by column.
+
+    Records are dumped to JSON-compatible values and stored column by column:
+    scalar fields as dictionary-encoded integer arrays (each distinct value is
+    stored once), nested models as a column per field, and lists of nested
+    models (e.g., creator, keyword, distribution) as offsets into a single
+    column of their items. Rows are materialized back into model instances on
+    demand, so only the records being used hold a pydantic instance.
+
+    Example
+    -------
+    catalog = ColumnarCatalog.from_models(releases, DataRelease)
+    release = catalog.get("1234ab")
+    titles = catalog.column("title")
+    """
+
+    def __init__(self, model, root, index):
+        self.model = model
+        self._root = root
+        self._index = index
+
+    @classmethod
+    def from_models(cls, records, model=None):
+        """Build a catalog from model instances. model defaults to the type of the first record.
+
+        Every record must be exactly of type model, since rows are materialized
+        as model and the fields of a subclass would be dropped. Raises
+        ValueError if two records share a usgsIdentifier.
+        """
+        root = _StructColumn()
+        index = {}
+        for record in records:
+            if model is None:
+                model = type(record)
+            elif type(record) is not model:
+                raise TypeError(f"Expected {model.__name__} records, got {type(record).__name__}")
+            document = record.model_dump(mode="json")
+            if document["usgsIdentifier"] in index:
+                raise ValueError(f"Duplicate usgsIdentifier {document['usgsIdentifier']!r}")
+            index[document["usgsIdentifier"]] = len(root)
+            root.append(document)
+        if model is None:
+            raise ValueError("A model is required to build an empty catalog")
+        root.freeze()
+        return cls(model, root, index)
+
+    def __len__(self):
+        return len(self._root)
+
+    def __contains__(self, usgsIdentifier):
+        return usgsIdentifier in self._index
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("ColumnarCatalog index out of range")
+        return self.model.model_validate(self._root.get(i))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def get(self, usgsIdentifier, default=None):
+        """Materialize the record with the given usgsIdentifier."""
+        i = self._index.get(usgsIdentifier)
+        return default if i is None else self[i]
+
+    def row(self, i):
+        """The JSON-compatible document of row i, without model validation."""
+        return self._root.get(i)
+
+    def column(self, path):
+        """Decoded values of a scalar field for every row, e.g. "status" or "license.license"."""
+        column = self._root
+        for name in path.split("."):
+            if not isinstance(column, _StructColumn):
+                raise KeyError(f"{path!r} is not a field of nested models")
+            column = column.children.get(name)
+            if column is None:
+                return [None] * len(self)
+        if not isinstance(column, _ScalarColumn):
+            raise KeyError(f"{path!r} is not a scalar field")
+        values = column.values
+        return [None if code < 0 else values[code] for code in column.codes]
+
+    def to_models(self):
+        return list(self)
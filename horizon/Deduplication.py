@@ -0,0 +1,151 @@
+import hashlib
+import random
+import re
+import unicodedata
+from collections import defaultdict
+
+# Permutations are computed as (a * x + b) mod a Mersenne prime over 64-bit
+# token hashes.
+MERSENNE_PRIME = (1 << 61) - 1
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def normalize_text(text):
+    """Lowercase, strip accents and punctuation, and split text into words."""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return _WORD.findall(text.casefold())
+
+
+def shingles(record, size=3):
+    """The set of features of a record used to estimate similarity.
+
+    Title and description contribute word n-grams of the given size. Each
+    creator contributes their normalized name, with name parts sorted so that
+    "Serna, Brandon" and "Brandon Serna" match.
+    """
+    features = set()
+    for prefix, text in (("t", record.title), ("d", record.description)):
+        words = normalize_text(text)
+        for i in range(max(len(words) - size, 0) + 1 if words else 0):
+            features.add(f"{prefix}:{' '.join(words[i : i + size])}")
+    for creator in getattr(record, "creator", None) or ():
+        features.add("c:" + " ".join(sorted(normalize_text(creator.name))))
+    return features
+
+
+def _token_hash(token):
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+
+
+class DeduplicationIndex:
+    """Find near-duplicate records with MinHash signatures and LSH banding.
+
+    Each record's title, description, and creator names are reduced to a
+    MinHash signature of num_perm values. Signatures are split into bands of
+    rows values, and records sharing any band are candidate duplicates. The
+    candidates are kept if their estimated Jaccard similarity is at least
+    threshold. Looking up one record only touches the records that share a
+    band with it, so it does not grow with the size of the catalog.
+    """
+
+    def __init__(self, num_perm=128, bands=16, threshold=0.7, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+        self._signatures = {}
+        self._buckets = [defaultdict(set) for _ in range(bands)]
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def __contains__(self, usgsIdentifier):
+        return usgsIdentifier in self._signatures
+
+    def signature(self, record):
+        """Compute the MinHash signature of a record."""
+        hashes = [_token_hash(token) for token in shingles(record)]
+        if not hashes:
+            return (MERSENNE_PRIME,) * self.num_perm
+        return tuple(min((a * h + b) % MERSENNE_PRIME for h in hashes) for a, b in self._permutations)
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [hash(signature[i * rows : (i + 1) * rows]) for i in range(self.bands)]
+
+    @staticmethod
+    def similarity(signature, other):
+        """Estimate the Jaccard similarity of two records from their signatures."""
+        return sum(x == y for x, y in zip(signature, other)) / len(signature)
+
+    def add(self, record):
+        """Add or replace a record in the index."""
+        self.remove(record.usgsIdentifier)
+        signature = self.signature(record)
+        self._signatures[record.usgsIdentifier] = signature
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            bucket[key].add(record.usgsIdentifier)
+
+    def add_many(self, records):
+        for record in records:
+            self.add(record)
+
+    def remove(self, usgsIdentifier):
+        signature = self._signatures.pop(usgsIdentifier, None)
+        if signature is None:
+            return
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            bucket[key].discard(usgsIdentifier)
+            if not bucket[key]:
+                del bucket[key]
+
+    def _candidates(self, usgsIdentifier, signature):
+        found = set()
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            found.update(bucket.get(key, ()))
+        found.discard(usgsIdentifier)
+        scored = []
+        for other in found:
+            score = self.similarity(signature, self._signatures[other])
+            if score >= self.threshold:
+                scored.append((other, score))
+        return sorted(scored, key=lambda item: (-item[1], item[0]))
+
+    def candidates(self, record):
+        """Return (usgsIdentifier, similarity) for indexed records that are likely duplicates of record.
+
+        The record does not need to be in the index, and it is not added.
+        """
+        return self._candidates(record.usgsIdentifier, self.signature(record))
+
+    def clusters(self):
+        """Return the groups of indexed records that are likely duplicates of each other.
+
+        Groups are sets of usgsIdentifier with at least two members, connected
+        by pairs whose similarity meets the threshold.
+        """
+        parent = {}
+
+        def find(x):
+            parent.setdefault(x, x)
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for usgsIdentifier, signature in self._signatures.items():
+            for other, _ in self._candidates(usgsIdentifier, signature):
+                parent[find(usgsIdentifier)] = find(other)
+
+        groups = defaultdict(set)
+        for x in parent:
+            groups[find(x)].add(x)
+        return [group for group in groups.values() if len(group) > 1]
@@ -2,6 +2,11 @@ from enum import Enum
 
 from pydantic import BaseModel
 
+# Fields holding a single Entity, and fields holding a list of Creators or
+# Contributors, on the catalog models.
+ENTITY_FIELDS = ("contactPoint", "usgsMetadataContactPoint", "publisher", "usgsCreatedBy", "usgsModifiedBy")
+ENTITY_LIST_FIELDS = ("creator", "qualifiedAttribution")
+
 
 class NameTypeEnum(str, Enum):
     """The type of entity described by a name
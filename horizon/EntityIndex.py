@@ -0,0 +1,155 @@
+import re
+from collections import defaultdict
+
+from pydantic import BaseModel
+
+from .Entity import ENTITY_FIELDS, ENTITY_LIST_FIELDS, ContributorTypeEnum
+
+_ORCID = re.compile(r"(?:^|orcid\.org/)(\d{4}-\d{4}-\d{4}-\d{3}[\dX])/?$", re.IGNORECASE)
+_ROR = re.compile(r"ror\.org/(0[a-z0-9]{6}\d{2})/?$", re.IGNORECASE)
+
+
+def normalize_name_identifier(value):
+    """Normalize a nameIdentifier or affiliationIdentifier.
+
+    ORCID iDs, bare or as URLs, become "orcid:<iD>", and ROR IDs given as
+    ror.org URLs become "ror:<ID>". A bare ROR ID cannot be told apart from
+    other short identifiers, so it is not rewritten. Other identifiers are
+    lowercased with their URL scheme and trailing slash removed. Returns None
+    for a missing or blank identifier.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if not value:
+        return None
+    match = _ORCID.search(value)
+    if match:
+        return "orcid:" + match.group(1).upper()
+    match = _ROR.search(value)
+    if match:
+        return "ror:" + match.group(1).lower()
+    return re.sub(r"^https?://", "", value.lower()).rstrip("/")
+
+
+class EntityOccurrence(BaseModel):
+    """An appearance of a person, organization, or service in a record.
+
+    Fields
+    ------
+    usgsIdentifier: Identifier of the record the entity appears in.
+    role: The field of the record the entity appears in (e.g., creator,
+        qualifiedAttribution, contactPoint, publisher, usgsModifiedBy).
+    contributorType: The type of contributor, for qualifiedAttribution.
+    name: Name by which the entity is known in the record.
+    position: Position that the creator or contributor appears within a citation.
+    """
+
+    usgsIdentifier: str
+    role: str
+    contributorType: ContributorTypeEnum | None = None
+    name: str
+    position: int | None = None
+
+
+def _occurrences(record):
+    """Yield (keys, affiliation key, occurrence) for every entity in a record."""
+    people = [(name, getattr(record, name, None)) for name in ENTITY_FIELDS]
+    for name in ENTITY_LIST_FIELDS:
+        people.extend((name, entity) for entity in getattr(record, name, None) or ())
+    for role, entity in people:
+        if entity is None:
+            continue
+        keys = set()
+        identifier = normalize_name_identifier(entity.nameIdentifier)
+        if identifier is not None:
+            keys.add(identifier)
+        if entity.entity_id is not None:
+            keys.add("entity_id:" + entity.entity_id)
+        affiliation = normalize_name_identifier(getattr(entity, "affiliationIdentifier", None))
+        occurrence = EntityOccurrence(
+            usgsIdentifier=record.usgsIdentifier,
+            role=role,
+            contributorType=getattr(entity, "contributorType", None),
+            name=entity.name,
+            position=getattr(entity, "position", None),
+        )
+        yield keys, affiliation, occurrence
+
+
+class EntityIndex:
+    """Reverse index from people and organizations to the records they appear in.
+
+    Entities are indexed by their normalized nameIdentifier and by entity_id,
+    and by their normalized affiliationIdentifier for organization queries.
+    Records can be added, replaced, and removed individually.
+
+    Example
+    -------
+    index = EntityIndex(releases)
+    index.records(nameIdentifier="https://orcid.org/0000-0002-1825-0097")
+    index.affiliated("https://ror.org/035a68863")
+    """
+
+    def __init__(self, records=()):
+        self._people = defaultdict(lambda: defaultdict(list))
+        self._affiliations = defaultdict(lambda: defaultdict(list))
+        self._keys = {}
+        for record in records:
+            self.add(record)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, record):
+        """Index a record, replacing a previously indexed version of it."""
+        rid = record.usgsIdentifier
+        self.remove(rid)
+        people, affiliations = set(), set()
+        for keys, affiliation, occurrence in _occurrences(record):
+            for key in keys:
+                self._people[key][rid].append(occurrence)
+                people.add(key)
+            if affiliation is not None:
+                self._affiliations[affiliation][rid].append(occurrence)
+                affiliations.add(affiliation)
+        self._keys[rid] = (people, affiliations)
+
+    def remove(self, usgsIdentifier):
+        """Remove a record from the index. Removing an unknown record does nothing."""
+        keys = self._keys.pop(usgsIdentifier, None)
+        if keys is None:
+            return
+        for postings, record_keys in zip((self._people, self._affiliations), keys):
+            for key in record_keys:
+                del postings[key][usgsIdentifier]
+                if not postings[key]:
+                    del postings[key]
+
+    @staticmethod
+    def _select(postings, roles):
+        return [
+            occurrence
+            for occurrences in postings.values()
+            for occurrence in occurrences
+            if roles is None or occurrence.role in roles
+        ]
+
+    def occurrences(self, nameIdentifier=None, entity_id=None, roles=None):
+        """Return every occurrence of the entity with the given nameIdentifier or entity_id.
+
+        roles optionally restricts the occurrences to the given roles.
+        """
+        if (nameIdentifier is None) == (entity_id is None):
+            raise ValueError("Specify exactly one of nameIdentifier or entity_id")
+        key = normalize_name_identifier(nameIdentifier) if entity_id is None else "entity_id:" + entity_id
+        return self._select(self._people.get(key, {}), roles)
+
+    def records(self, nameIdentifier=None, entity_id=None, roles=None):
+        """Return the usgsIdentifier of every record the entity appears in, sorted."""
+        occurrences = self.occurrences(nameIdentifier=nameIdentifier, entity_id=entity_id, roles=roles)
+        return sorted({occurrence.usgsIdentifier for occurrence in occurrences})
+
+    def affiliated(self, affiliationIdentifier, roles=None):
+        """Return every occurrence of a creator or contributor affiliated with an organization."""
+        return self._select(self._affiliations.get(normalize_name_identifier(affiliationIdentifier), {}), roles)
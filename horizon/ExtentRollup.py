@@ -0,0 +1,234 @@
+import bisect
+
+from .CatalogIntegrity import normalize_identifier
+from .Dataset import PeriodOfTime
+from .Location import BoundingBox, Location, bbox_bounds
+
+
+def _insert(values, value):
+    bisect.insort(values, value)
+
+
+def _remove(values, value):
+    del values[bisect.bisect_left(values, value)]
+
+
+class _Extent:
+    """Spatial and temporal extents contributed by the components of one parent.
+
+    Every bound is kept in a sorted list so that a component can be added or
+    removed without revisiting the others. Bounds are kept with the string
+    they were given as so that the rolled-up bounding box uses the
+    components' own formatting. The union of the longitude ranges is cached
+    and recomputed on the next read after a bounding box is added or removed.
+    """
+
+    def __init__(self):
+        self.south = []
+        self.north = []
+        self.longitudes = []
+        self.starts = []
+        self.ends = []
+        self.open_starts = 0
+        self.open_ends = 0
+        self.periods = 0
+        self._union = None
+
+    def __bool__(self):
+        return bool(self.longitudes) or bool(self.periods)
+
+    @classmethod
+    def combine(cls, extents):
+        """Return an extent covering all of extents."""
+        if len(extents) == 1:
+            return extents[0]
+        combined = cls()
+        for extent in extents:
+            for name in ("south", "north", "longitudes", "starts", "ends"):
+                getattr(combined, name).extend(getattr(extent, name))
+            combined.open_starts += extent.open_starts
+            combined.open_ends += extent.open_ends
+            combined.periods += extent.periods
+        for name in ("south", "north", "longitudes", "starts", "ends"):
+            getattr(combined, name).sort()
+        return combined
+
+    def update(self, contribution, sign):
+        bbox, period = contribution
+        change = _insert if sign > 0 else _remove
+        if bbox is not None:
+            west, south, east, north = bbox
+            change(self.south, south)
+            change(self.north, north)
+            change(self.longitudes, (west, east))
+            self._union = None
+        if period is not None:
+            start, end = period
+            self.periods += sign
+            if start is None:
+                self.open_starts += sign
+            else:
+                change(self.starts, start)
+            if end is None:
+                self.open_ends += sign
+            else:
+                change(self.ends, end)
+
+    def bbox(self):
+        if not self.longitudes:
+            return None
+        if self._union is None:
+            self._union = _longitude_union(self.longitudes)
+        west, east = self._union
+        return BoundingBox(
+            westBoundLongitude=west[1],
+            eastBoundLongitude=east[1],
+            southBoundLatitude=self.south[0][1],
+            northBoundLatitude=self.north[-1][1],
+        )
+
+    def period(self):
+        if not self.periods:
+            return None
+        return PeriodOfTime(
+            startDate=None if self.open_starts else self.starts[0],
+            endDate=None if self.open_ends else self.ends[-1],
+        )
+
+
+def _longitude_union(ranges):
+    """Return (west, east) of the smallest longitude range covering all ranges.
+
+    Ranges whose west bound is greater than their east bound cross the
+    antimeridian. The union is the complement of the largest gap between the
+    ranges around the globe, so it may itself cross the antimeridian.
+    """
+    pieces = []
+    for west, east in ranges:
+        if west[0] <= east[0]:
+            pieces.append((west, east))
+        else:
+            pieces.append((west, (180.0, "180")))
+            pieces.append(((-180.0, "-180"), east))
+    pieces.sort()
+
+    merged = [list(pieces[0])]
+    for west, east in pieces[1:]:
+        if west[0] <= merged[-1][1][0]:
+            merged[-1][1] = max(merged[-1][1], east)
+        else:
+            merged.append([west, east])
+
+    # The gap around the antimeridian, from the last range back to the first
+    gap = merged[0][0][0] + 360 - merged[-1][1][0]
+    bounds = (merged[0][0], merged[-1][1])
+    for previous, following in zip(merged, merged[1:]):
+        if following[0][0] - previous[1][0] > gap:
+            gap = following[0][0] - previous[1][0]
+            bounds = (following[0], previous[1])
+    if gap <= 0:
+        return (-180.0, "-180"), (180.0, "180")
+    return bounds
+
+
+def contribution(component):
+    """The bounding box and period of time a component contributes to its parent.
+
+    A bounding box with a bound that is not a number (e.g., "" or "N/A") is
+    not contributed, as in CatalogQuery.
+    """
+    bbox = component.spatial.bbox if getattr(component, "spatial", None) is not None else None
+    bounds = bbox_bounds(bbox)
+    if bounds is not None:
+        values = (bbox.westBoundLongitude, bbox.southBoundLatitude, bbox.eastBoundLongitude, bbox.northBoundLatitude)
+        bounds = tuple(zip(bounds, values))
+    temporal = getattr(component, "temporal", None)
+    period = None
+    if temporal is not None and (temporal.startDate is not None or temporal.endDate is not None):
+        period = (temporal.startDate, temporal.endDate)
+    return bounds, period
+
+
+class ExtentRollup:
+    """Incrementally maintained spatial and temporal extents of DataReleases from their components.
+
+    The extent of a parent (the component's isPartOf, normalized with
+    normalize_identifier so that equivalent DOI and URL forms share one
+    aggregate) is the union of its components' spatial.bbox, handling bounding boxes that cross the
+    antimeridian, and the period from the earliest startDate to the latest
+    endDate. If any component's period has no start (or no end), the rolled-up
+    period is open at that end as well.
+
+    Inserting, updating, or removing a component only updates its parent's
+    sorted bounds; other components are not reloaded. The west and east
+    bounds of a parent depend on all of its longitude ranges, so they are
+    recomputed (in O(n log n) of its components) on the first read after one
+    of its bounding boxes changes, and cached until the next change.
+    """
+
+    def __init__(self, components=()):
+        self._extents = {}
+        self._components = {}
+        for component in components:
+            self.upsert(component)
+
+    def __len__(self):
+        return len(self._components)
+
+    def upsert(self, component):
+        """Add a component, or replace a previous version of it."""
+        self.remove(component.usgsIdentifier)
+        parent = normalize_identifier(component.isPartOf)
+        value = contribution(component)
+        self._components[component.usgsIdentifier] = (parent, value)
+        self._extents.setdefault(parent, _Extent()).update(value, 1)
+
+    def remove(self, usgsIdentifier):
+        """Remove a component. Removing an unknown component does nothing."""
+        previous = self._components.pop(usgsIdentifier, None)
+        if previous is None:
+            return
+        parent, value = previous
+        extent = self._extents[parent]
+        extent.update(value, -1)
+        if not extent:
+            del self._extents[parent]
+
+    def _extent(self, parents):
+        keys = {normalize_identifier(parent) for parent in parents if parent is not None}
+        extents = [self._extents[key] for key in keys if key in self._extents]
+        return _Extent.combine(extents) if extents else None
+
+    def spatial(self, *parents):
+        """The rolled-up Location of a parent, or None if no component has a bounding box.
+
+        A parent may be given by several identifiers (e.g., its usgsIdentifier
+        and DOI), in which case components referring to it by any of them are
+        rolled up together.
+        """
+        extent = self._extent(parents)
+        bbox = extent.bbox() if extent is not None else None
+        return Location(bbox=bbox) if bbox is not None else None
+
+    def temporal(self, *parents):
+        """The rolled-up PeriodOfTime of a parent, or None if no component has one. See spatial."""
+        extent = self._extent(parents)
+        return extent.period() if extent is not None else None
+
+    def apply(self, release, parent=None):
+        """Return a copy of release with the rolled-up spatial and temporal extents.
+
+        parent defaults to the release's usgsIdentifier and identifier, so
+        components referring to the release by either are included. Extents
+        that no component provides are left as they are on the release.
+        """
+        parents = (release.usgsIdentifier, release.identifier) if parent is None else (parent,)
+        extent = self._extent(parents)
+        update = {}
+        bbox = extent.bbox() if extent is not None else None
+        if bbox is not None:
+            update["spatial"] = Location(bbox=bbox)
+        temporal = extent.period() if extent is not None else None
+        if temporal is not None:
+            update["temporal"] = temporal
+        return release.model_copy(update=update)
@@ -0,0 +1,221 @@
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+from pydantic import TypeAdapter, ValidationError
+
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+HELP = {
+    "horizon_validation_seconds": "Time spent validating a model.",
+    "horizon_field_validation_seconds": "Time spent validating a top-level field of a model.",
+    "horizon_serialization_seconds": "Time spent dumping a model.",
+    "horizon_field_serialization_seconds": "Time spent dumping a top-level field of a model.",
+    "horizon_payload_bytes": "Size of JSON payloads validated or produced.",
+    "horizon_records_total": "Number of records validated or dumped.",
+    "horizon_validation_errors_total": "Number of validation errors by field path.",
+}
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds, as in the Prometheus data model."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _labels(labels, extra=()):
+    pairs = tuple(labels) + tuple(extra)
+    if not pairs:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for name, value in pairs
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+class Metrics:
+    """Thread-safe collection of counters and histograms, keyed by metric name and labels."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+
+    def increment(self, name, labels, amount=1):
+        key = (name, tuple(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, labels, value, buckets=LATENCY_BUCKETS):
+        key = (name, tuple(labels))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def render(self):
+        """Render a snapshot of the metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            names = sorted({name for name, _ in self.counters} | {name for name, _ in self.histograms})
+            for name in names:
+                if name in HELP:
+                    lines.append(f"# HELP {name} {HELP[name]}")
+                counters = sorted((labels, value) for (n, labels), value in self.counters.items() if n == name)
+                histograms = sorted((labels, h) for (n, labels), h in self.histograms.items() if n == name)
+                if counters:
+                    lines.append(f"# TYPE {name} counter")
+                    lines.extend(f"{name}{_labels(labels)} {value}" for labels, value in counters)
+                if histograms:
+                    lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in histograms:
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + ("+Inf",), histogram.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_labels(labels, [('le', bound)])} {cumulative}")
+                    lines.append(f"{name}_sum{_labels(labels)} {histogram.sum}")
+                    lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class Instrumentation:
+    """Opt-in timing and counting of model validation and dumping.
+
+    Use validate(), validate_json(), dump(), and dump_json() in place of the
+    corresponding pydantic methods. When disabled, they call pydantic directly
+    after a single flag check. When enabled, they record per-model latency,
+    record counts, payload sizes, and validation errors by field path. With
+    field_timing, each top-level field is also validated or dumped on its own
+    to record per-field latency; this roughly doubles the cost and is meant
+    for profiling rather than production.
+
+    Example
+    -------
+    with instrumentation.profile() as metrics:
+        for document in documents:
+            instrumentation.validate_json(DataRelease, document)
+    print(metrics.render())
+    """
+
+    def __init__(self, enabled=False, field_timing=False):
+        self.enabled = enabled
+        self.field_timing = field_timing
+        self.metrics = Metrics()
+        self._adapters = {}
+
+    def _adapter(self, model, name, field):
+        key = (model, name)
+        adapter = self._adapters.get(key)
+        if adapter is None:
+            adapter = self._adapters[key] = TypeAdapter(field.annotation)
+        return adapter
+
+    def _time_fields(self, model, data, operation):
+        metric = f"horizon_field_{operation}_seconds"
+        for name, field in model.model_fields.items():
+            if name not in data:
+                continue
+            adapter = self._adapter(model, name, field)
+            start = time.perf_counter()
+            try:
+                if operation == "validation":
+                    adapter.validate_python(data[name])
+                else:
+                    adapter.dump_python(data[name], mode="json")
+            except ValidationError:
+                pass
+            self.metrics.observe(metric, [("model", model.__name__), ("field", name)], time.perf_counter() - start)
+
+    def _validate(self, model, data, validator, operation, size=None):
+        labels = [("model", model.__name__)]
+        start = time.perf_counter()
+        try:
+            instance = validator(data)
+        except ValidationError as e:
+            self.metrics.increment("horizon_records_total", labels + [("operation", operation), ("outcome", "error")])
+            for error in e.errors():
+                path = ".".join(str(part) for part in error["loc"])
+                self.metrics.increment("horizon_validation_errors_total", labels + [("field_path", path)])
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.metrics.observe("horizon_validation_seconds", labels + [("operation", operation)], elapsed)
+            if size is not None:
+                self.metrics.observe("horizon_payload_bytes", labels + [("operation", operation)], size, SIZE_BUCKETS)
+        self.metrics.increment("horizon_records_total", labels + [("operation", operation), ("outcome", "ok")])
+        if self.field_timing:
+            if isinstance(data, (str, bytes, bytearray)):
+                data = json.loads(data)
+            if isinstance(data, dict):
+                self._time_fields(model, data, "validation")
+        return instance
+
+    def validate(self, model, data):
+        """model.model_validate(data), instrumented."""
+        if not self.enabled:
+            return model.model_validate(data)
+        return self._validate(model, data, model.model_validate, "validate")
+
+    def validate_json(self, model, data):
+        """model.model_validate_json(data), instrumented."""
+        if not self.enabled:
+            return model.model_validate_json(data)
+        size = len(data.encode()) if isinstance(data, str) else len(data)
+        return self._validate(model, data, model.model_validate_json, "validate_json", size)
+
+    def _dump(self, instance, dumper, operation, kwargs):
+        model = type(instance)
+        labels = [("model", model.__name__)]
+        start = time.perf_counter()
+        output = dumper(**kwargs)
+        elapsed = time.perf_counter() - start
+        self.metrics.observe("horizon_serialization_seconds", labels + [("operation", operation)], elapsed)
+        self.metrics.increment("horizon_records_total", labels + [("operation", operation), ("outcome", "ok")])
+        if isinstance(output, str):
+            size = len(output.encode())
+            self.metrics.observe("horizon_payload_bytes", labels + [("operation", operation)], size, SIZE_BUCKETS)
+        if self.field_timing:
+            self._time_fields(model, {name: getattr(instance, name) for name in model.model_fields}, "serialization")
+        return output
+
+    def dump(self, instance, **kwargs):
+        """instance.model_dump(**kwargs), instrumented."""
+        if not self.enabled:
+            return instance.model_dump(**kwargs)
+        return self._dump(instance, instance.model_dump, "dump", kwargs)
+
+    def dump_json(self, instance, **kwargs):
+        """instance.model_dump_json(**kwargs), instrumented."""
+        if not self.enabled:
+            return instance.model_dump_json(**kwargs)
+        return self._dump(instance, instance.model_dump_json, "dump_json", kwargs)
+
+    def render(self):
+        """The current metrics in the Prometheus text exposition format."""
+        return self.metrics.render()
+
+    @contextmanager
+    def profile(self, field_timing=True):
+        """Enable instrumentation for a block, collecting into fresh Metrics that are yielded."""
+        previous = (self.enabled, self.field_timing, self.metrics)
+        self.enabled, self.field_timing, self.metrics = True, field_timing, Metrics()
+        try:
+            yield self.metrics
+        finally:
+            self.enabled, self.field_timing, self.metrics = previous
+
+
+instrumentation = Instrumentation()
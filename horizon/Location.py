@@ -19,6 +19,21 @@ class BoundingBox(BaseModel):
     northBoundLatitude: str
 
 
+def bbox_bounds(bbox):
+    """Return (west, south, east, north) as floats, or None if bbox is missing or invalid."""
+    if bbox is None:
+        return None
+    try:
+        return (
+            float(bbox.westBoundLongitude),
+            float(bbox.southBoundLatitude),
+            float(bbox.eastBoundLongitude),
+            float(bbox.northBoundLatitude),
+        )
+    except (TypeError, ValueError):
+        return None
+
+
 class Centroid(BaseModel):
     """The longitude and latitude coordinates of the Location's centroid
 
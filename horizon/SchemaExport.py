@@ -0,0 +1,179 @@
+import hashlib
+import importlib
+import json
+import pkgutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pydantic import BaseModel
+
+try:
+    import erdantic as erd
+except ImportError:
+    erd = None
+
+MANIFEST_NAME = ".fingerprints.json"
+
+
+def discover_models(package="horizon"):
+    """Return the data models in package, by name.
+
+    A data model is a pydantic model named after the module that defines it
+    (e.g., horizon/Dataset.py defines Dataset).
+    """
+    package = importlib.import_module(package)
+    models = {}
+    for info in sorted(pkgutil.iter_modules(package.__path__), key=lambda i: i.name):
+        module = importlib.import_module(f"{package.__name__}.{info.name}")
+        model = getattr(module, info.name, None)
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            models[info.name] = model
+    return models
+
+
+def fingerprint(schema):
+    """A stable hash of a JSON Schema, used to detect changes to its source model."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class _Manifest:
+    """Fingerprints of the artifacts previously written to a directory.
+
+    The manifest is kept in the directory itself, or in manifest_dir (named
+    after the directory) so that it stays out of a tracked output directory.
+    """
+
+    def __init__(self, directory, manifest_dir=None):
+        if manifest_dir is None:
+            self.path = Path(directory) / MANIFEST_NAME
+        else:
+            self.path = Path(manifest_dir) / f"{Path(directory).name}{MANIFEST_NAME}"
+        self.fingerprints = json.loads(self.path.read_text()) if self.path.exists() else {}
+
+    def is_current(self, artifact, value):
+        return self.fingerprints.get(artifact.name) == value and artifact.exists()
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.fingerprints, indent=2, sort_keys=True))
+
+
+class SchemaExporter:
+    """Export JSON Schemas and ER diagrams for the Horizon data models.
+
+    Models are exported in parallel. An artifact is only rewritten when the
+    fingerprint of its model's schema differs from the one recorded in the
+    output directory's manifest, or when force is true. Manifests are written
+    to manifest_dir when it is given, and otherwise to the output directories
+    themselves. ER diagrams are rendered only when erdantic is installed.
+    """
+
+    def __init__(self, schema_dir=None, diagram_dir=None, models=None, max_workers=None, manifest_dir=None):
+        self.schema_dir = Path(schema_dir) if schema_dir is not None else None
+        self.diagram_dir = Path(diagram_dir) if diagram_dir is not None else None
+        self.manifest_dir = Path(manifest_dir) if manifest_dir is not None else None
+        self.models = models if models is not None else discover_models()
+        self.max_workers = max_workers
+
+    def export(self, force=False):
+        """Export all models and return the paths written and skipped, by kind."""
+        result = {"written": [], "skipped": []}
+        manifests = {}
+        for directory in (self.schema_dir, self.diagram_dir):
+            if directory is not None:
+                directory.mkdir(parents=True, exist_ok=True)
+                manifests[directory] = _Manifest(directory, self.manifest_dir)
+
+        def export_model(item):
+            name, model = item
+            schema = model.model_json_schema()
+            value = fingerprint(schema)
+            outcomes = []
+            if self.schema_dir is not None:
+                path = self.schema_dir / f"{name}.json"
+                if force or not manifests[self.schema_dir].is_current(path, value):
+                    path.write_text(json.dumps(schema, indent=2))
+                    outcomes.append(("written", path, value))
+                else:
+                    outcomes.append(("skipped", path, value))
+            if self.diagram_dir is not None and erd is not None:
+                path = self.diagram_dir / f"{name}-diagram.png"
+                if force or not manifests[self.diagram_dir].is_current(path, value):
+                    erd.draw(model, out=path)
+                    outcomes.append(("written", path, value))
+                else:
+                    outcomes.append(("skipped", path, value))
+            return outcomes
+
+        with ThreadPoolExecutor(self.max_workers) as pool:
+            for outcomes in pool.map(export_model, self.models.items()):
+                for outcome, path, value in outcomes:
+                    manifests[path.parent].fingerprints[path.name] = value
+                    result[outcome].append(path)
+
+        for manifest in manifests.values():
+            manifest.save()
+        return result
+
+
+class SchemaRegistry:
+    """In-memory registry of JSON Schemas for resolving $ref pointers.
+
+    References may be local to a schema ("#/$defs/Keyword", resolved against
+    base) or name another registered schema ("Dataset.json#/$defs/Keyword").
+    Resolved references are cached.
+    """
+
+    def __init__(self, schemas=None):
+        self._schemas = dict(schemas or {})
+        self._resolved = {}
+
+    @classmethod
+    def from_models(cls, models=None):
+        models = models if models is not None else discover_models()
+        return cls({name: model.model_json_schema() for name, model in models.items()})
+
+    @classmethod
+    def from_directory(cls, directory):
+        """Load the schemas in a directory, such as one written by SchemaExporter, skipping its manifest."""
+        return cls(
+            {
+                path.stem: json.loads(path.read_text())
+                for path in Path(directory).glob("*.json")
+                if path.name != MANIFEST_NAME
+            }
+        )
+
+    def __contains__(self, name):
+        return name in self._schemas
+
+    def __iter__(self):
+        return iter(self._schemas)
+
+    def add(self, name, schema):
+        self._schemas[name] = schema
+        self._resolved.clear()
+
+    def get(self, name):
+        return self._schemas[name]
+
+    def resolve(self, ref, base=None):
+        """Return the schema fragment that ref points to."""
+        key = (ref, base)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        document, _, pointer = ref.partition("#")
+        name = Path(document).name.removesuffix(".json") if document else base
+        if name not in self._schemas:
+            raise KeyError(f"Unknown schema in reference: {ref!r}")
+        node = self._schemas[name]
+        for token in filter(None, pointer.split("/")):
+            token = token.replace("~1", "/").replace("~0", "~")
+            try:
+                node = node[int(token)] if isinstance(node, list) else node[token]
+            except (KeyError, IndexError, ValueError):
+                raise KeyError(f"Unresolvable reference: {ref!r}") from None
+        self._resolved[key] = node
+        return node
@@ -0,0 +1,234 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from pydantic import BaseModel
+
+SCHEMA_VERSION_KEY = "schemaVersion"
+
+# Documents stored before versioning was introduced carry no schemaVersion
+# and are treated as version 1.
+INITIAL_SCHEMA_VERSION = 1
+
+
+def _model_name(model):
+    return model if isinstance(model, str) else model.__name__
+
+
+class MigrationRegistry:
+    """Registry of schema versions and migration functions for stored documents.
+
+    Each model has a current schema version. A migration function upgrades a
+    document (a dict as loaded from JSON) of one model from one version to the
+    next and returns the upgraded document. Migrations are applied lazily, when
+    a document is read, so that a schema change does not require rewriting
+    every stored document up front.
+
+    Example
+    -------
+    @registry.register(Location, from_version=1)
+    def bbox_strings_to_numbers(document):
+        ...
+        return document
+    """
+
+    def __init__(self):
+        self._versions = {}
+        self._migrations = {}
+
+    def current_version(self, model):
+        """The schema version that documents of model are written with."""
+        return self._versions.get(_model_name(model), INITIAL_SCHEMA_VERSION)
+
+    def register(self, model, from_version, to_version=None):
+        """Register a migration of model documents from from_version to to_version.
+
+        to_version defaults to from_version + 1. The current version of model is
+        advanced to to_version if it is not already later. Used as a decorator.
+        """
+        name = _model_name(model)
+        to_version = from_version + 1 if to_version is None else to_version
+        if to_version <= from_version:
+            raise ValueError(f"Migration of {name} must move to a later version")
+        if (name, from_version) in self._migrations:
+            raise ValueError(f"A migration of {name} from version {from_version} is already registered")
+
+        def decorator(fn):
+            self._migrations[(name, from_version)] = (to_version, fn)
+            self._versions[name] = max(self.current_version(name), to_version)
+            return fn
+
+        return decorator
+
+    def needs_migration(self, document, model):
+        """Indicates whether document is older than the current version of model."""
+        version = document.get(SCHEMA_VERSION_KEY, INITIAL_SCHEMA_VERSION)
+        return version != self.current_version(model)
+
+    def migrate(self, document, model):
+        """Return document upgraded to the current version of model.
+
+        The input document is not modified. Raises ValueError if the document
+        was written with a newer schema version or if no migration path exists.
+        """
+        name = _model_name(model)
+        target = self.current_version(name)
+        version = document.get(SCHEMA_VERSION_KEY, INITIAL_SCHEMA_VERSION)
+        if version > target:
+            raise ValueError(
+                f"{name} document has schema version {version}, newer than the current version {target}"
+            )
+        if version == target:
+            return document
+
+        document = dict(document)
+        while version < target:
+            try:
+                next_version, fn = self._migrations[(name, version)]
+            except KeyError:
+                raise ValueError(f"No migration registered for {name} from version {version}") from None
+            document = fn(document)
+            version = next_version
+        document[SCHEMA_VERSION_KEY] = version
+        return document
+
+    def load(self, document, model):
+        """Migrate document to the current version of model and validate it."""
+        document = dict(self.migrate(document, model))
+        document.pop(SCHEMA_VERSION_KEY, None)
+        return model.model_validate(document)
+
+    def load_file(self, path, model, write_back=False):
+        """Read, migrate, and validate a stored JSON document.
+
+        If write_back is true and the document was migrated, the upgraded
+        document is written back to path.
+        """
+        with open(path) as f:
+            document = json.load(f)
+        migrated = self.migrate(document, model)
+        instance = self.load(migrated, model)
+        if write_back and migrated is not document:
+            _write_json(path, migrated)
+        return instance
+
+    def dump(self, instance, **kwargs):
+        """Dump a model instance to a JSON-compatible dict stamped with its schema version."""
+        document = instance.model_dump(mode="json", **kwargs)
+        document[SCHEMA_VERSION_KEY] = self.current_version(type(instance))
+        return document
+
+
+def _write_json(path, document):
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(document, f, indent=2)
+    os.replace(tmp, path)
+
+
+registry = MigrationRegistry()
+
+
+class BulkMigrationResult(BaseModel):
+    """Summary of a bulk migration run.
+
+    Fields
+    ------
+    migrated: Number of documents upgraded and written back.
+    skipped: Number of documents already at the current version or completed
+        by a previous run.
+    failed: Error message for each document that could not be migrated, by path.
+    complete: Indicates whether every document was visited. False if the run
+        was stopped before it finished.
+    """
+
+    migrated: int = 0
+    skipped: int = 0
+    failed: dict[str, str] = {}
+    complete: bool = False
+
+
+class BulkMigrator:
+    """Upgrade every stored document of a model in a directory, in parallel and resumably.
+
+    Completed files are recorded in a checkpoint file next to the documents so
+    that a stopped or failed run can resume where it left off. Documents are
+    validated against the model before being written back and are replaced
+    atomically.
+    """
+
+    def __init__(self, model, directory, registry=registry, pattern="*.json", max_workers=None, checkpoint=None):
+        self.model = model
+        self.directory = Path(directory)
+        self.registry = registry
+        self.pattern = pattern
+        self.max_workers = max_workers
+        version = registry.current_version(model)
+        self.checkpoint = Path(checkpoint) if checkpoint is not None else (
+            self.directory / f".migration-{_model_name(model)}-v{version}.checkpoint"
+        )
+        self._stop = threading.Event()
+        self._executor = None
+
+    def _completed(self):
+        if not self.checkpoint.exists():
+            return set()
+        return set(self.checkpoint.read_text().splitlines())
+
+    def _migrate_file(self, path):
+        if self._stop.is_set():
+            return None
+        with open(path) as f:
+            document = json.load(f)
+        if not self.registry.needs_migration(document, self.model):
+            return False
+        migrated = self.registry.migrate(document, self.model)
+        self.registry.load(migrated, self.model)
+        _write_json(path, migrated)
+        return True
+
+    def run(self):
+        """Migrate all pending documents and return a BulkMigrationResult."""
+        self._stop.clear()
+        result = BulkMigrationResult()
+        completed = self._completed()
+        paths = []
+        for path in sorted(self.directory.glob(self.pattern)):
+            if path.name in completed:
+                result.skipped += 1
+            else:
+                paths.append(path)
+
+        with open(self.checkpoint, "a", buffering=1) as checkpoint, ThreadPoolExecutor(self.max_workers) as pool:
+            futures = {pool.submit(self._migrate_file, path): path for path in paths}
+            result.complete = True
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    migrated = future.result()
+                except Exception as e:
+                    result.failed[str(path)] = str(e)
+                    continue
+                if migrated is None:
+                    result.complete = False
+                    continue
+                if migrated:
+                    result.migrated += 1
+                else:
+                    result.skipped += 1
+                checkpoint.write(path.name + "\n")
+        return result
+
+    def start(self):
+        """Run the migration in a background thread and return a Future of its result."""
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        future = self._executor.submit(self.run)
+        self._executor.shutdown(wait=False)
+        return future
+
+    def stop(self):
+        """Ask a running migration to stop submitting documents. It can be resumed with run()."""
+        self._stop.set()
@@ -0,0 +1,172 @@
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from .DataRelease import StatusEnum
+from .Entity import Entity
+
+# The legal transitions of the curation lifecycle, from each status.
+TRANSITIONS = {
+    StatusEnum.created: {StatusEnum.submitted},
+    StatusEnum.submitted: {StatusEnum.locked, StatusEnum.provisional, StatusEnum.published},
+    StatusEnum.locked: {StatusEnum.provisional, StatusEnum.published},
+    StatusEnum.provisional: {StatusEnum.published, StatusEnum.underRevision, StatusEnum.deprecated},
+    StatusEnum.published: {StatusEnum.underRevision, StatusEnum.deprecated},
+    StatusEnum.underRevision: {StatusEnum.revisionSubmitted},
+    StatusEnum.revisionSubmitted: {StatusEnum.revised},
+    StatusEnum.revised: {StatusEnum.underRevision, StatusEnum.deprecated},
+    StatusEnum.deprecated: set(),
+}
+
+
+class StatusTransition(BaseModel):
+    """A change of status applied to a record, as written to the transition log.
+
+    Fields
+    ------
+    usgsIdentifier: Identifier of the record whose status changed.
+    fromStatus: The status before the transition.
+    toStatus: The status after the transition.
+    usgsModified: Date and time of the transition.
+    usgsModifiedBy: The entity responsible for the transition.
+    batchId: Identifier shared by all transitions applied together.
+    """
+
+    usgsIdentifier: str
+    fromStatus: StatusEnum
+    toStatus: StatusEnum
+    usgsModified: datetime
+    usgsModifiedBy: Entity | None = None
+    batchId: str
+
+
+class TransitionRejection(BaseModel):
+    """A requested transition that was not applied.
+
+    Fields
+    ------
+    usgsIdentifier: Identifier of the record.
+    fromStatus: The current status of the record.
+    toStatus: The requested status.
+    message: Why the transition was rejected.
+    """
+
+    usgsIdentifier: str
+    fromStatus: StatusEnum
+    toStatus: StatusEnum
+    message: str
+
+
+class TransitionResult(BaseModel):
+    """The outcome of a batch of transitions.
+
+    Fields
+    ------
+    batchId: Identifier shared by all transitions in the batch.
+    records: Copies of the records with the new status, usgsModified, and
+        usgsModifiedBy applied, in the order they were given.
+    applied: The transitions that were applied and logged.
+    rejected: The transitions that were not legal.
+    """
+
+    batchId: str
+    records: list = []
+    applied: list[StatusTransition] = []
+    rejected: list[TransitionRejection] = []
+
+
+class TransitionLog:
+    """Append-only JSON lines log of status transitions.
+
+    Each batch is appended with a single write followed by a single fsync.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def append(self, transitions):
+        if not transitions:
+            return
+        with open(self.path, "a") as f:
+            f.write("".join(t.model_dump_json() + "\n" for t in transitions))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def __iter__(self):
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            for line in f:
+                if line.strip():
+                    yield StatusTransition.model_validate_json(line)
+
+
+class StatusWorkflow:
+    """Validate and apply status transitions to batches of DataRelease or DataReleaseInitiation records.
+
+    A batch is checked against the transition table as a whole. With atomic
+    (the default), a batch containing any illegal transition applies nothing.
+    Applied transitions share one timestamp and batchId, are written to the
+    transition log in one grouped write before the updated records are
+    returned, and leave the input records unchanged.
+
+    Example
+    -------
+    workflow = StatusWorkflow(TransitionLog("transitions.jsonl"))
+    result = workflow.transition(approved, StatusEnum.published, usgsModifiedBy=curator)
+    """
+
+    def __init__(self, log=None, transitions=TRANSITIONS):
+        self.log = log
+        self.transitions = transitions
+
+    def can_transition(self, fromStatus, toStatus):
+        return StatusEnum(toStatus) in self.transitions.get(StatusEnum(fromStatus), ())
+
+    def transition(self, records, toStatus, usgsModifiedBy=None, atomic=True):
+        """Move records to toStatus and return a TransitionResult."""
+        toStatus = StatusEnum(toStatus)
+        result = TransitionResult(batchId=uuid.uuid4().hex)
+        now = datetime.now()
+        seen = set()
+        accepted = []
+        for record in records:
+            fromStatus = StatusEnum(record.status)
+            if record.usgsIdentifier in seen:
+                message = "Record appears more than once in the batch"
+            elif not self.can_transition(fromStatus, toStatus):
+                message = f"Cannot move from {fromStatus.value!r} to {toStatus.value!r}"
+            else:
+                seen.add(record.usgsIdentifier)
+                accepted.append((record, fromStatus))
+                continue
+            result.rejected.append(
+                TransitionRejection(
+                    usgsIdentifier=record.usgsIdentifier, fromStatus=fromStatus, toStatus=toStatus, message=message
+                )
+            )
+
+        if atomic and result.rejected:
+            return result
+
+        update = {"status": toStatus, "usgsModified": now}
+        if usgsModifiedBy is not None:
+            update["usgsModifiedBy"] = usgsModifiedBy
+        for record, fromStatus in accepted:
+            result.records.append(record.model_copy(update=update))
+            result.applied.append(
+                StatusTransition(
+                    usgsIdentifier=record.usgsIdentifier,
+                    fromStatus=fromStatus,
+                    toStatus=toStatus,
+                    usgsModified=now,
+                    usgsModifiedBy=usgsModifiedBy,
+                    batchId=result.batchId,
+                )
+            )
+        if self.log is not None:
+            self.log.append(result.applied)
+        return result
@@ -0,0 +1,221 @@
+import csv
+import json
+import types
+import typing
+from datetime import date, datetime, timezone
+from enum import Enum
+from pathlib import Path
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+KEY_COLUMNS = ("usgsIdentifier", "ordinal")
+
+
+def _unwrap_optional(annotation):
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_model(annotation):
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _scalar_type(annotation):
+    """The column type of a field: bool, int, float, str, date, datetime, or None for JSON text."""
+    if typing.get_origin(annotation) is not None:
+        return None
+    if not isinstance(annotation, type):
+        return str
+    if issubclass(annotation, Enum):
+        return str
+    for scalar in (bool, int, float, str, datetime, date):
+        if issubclass(annotation, scalar):
+            return scalar
+    return str
+
+
+class Table:
+    """Layout of one exported table.
+
+    Fields
+    ------
+    name: Name of the table and of its output file.
+    path: Field names leading from the parent model to the list that holds
+        this table's rows. Empty for the parent table.
+    columns: (column name, field path, column type) for each column.
+    """
+
+    def __init__(self, name, path=()):
+        self.name = name
+        self.path = path
+        self.columns = []
+
+    @property
+    def column_names(self):
+        return [name for name, _, _ in self.columns]
+
+
+def layout(model, name=None):
+    """Normalize a model into a parent table plus a child table per list of nested models.
+
+    Nested models are flattened into their table with "_" joined column
+    names (e.g., spatial_bbox_westBoundLongitude). Lists of nested models
+    (e.g., creator, keyword, distribution) become child tables keyed by the
+    parent's usgsIdentifier and the item's ordinal. Lists nested within a
+    child table and lists of scalars are kept as JSON text.
+    """
+    name = name or model.__name__
+    parent = Table(name)
+    tables = [parent]
+
+    def walk(model, table, prefix, allow_children):
+        for field_name, field in model.model_fields.items():
+            annotation = _unwrap_optional(field.annotation)
+            path = prefix + (field_name,)
+            if _is_model(annotation):
+                walk(annotation, table, path, allow_children)
+                continue
+            item = _unwrap_optional(typing.get_args(annotation)[0]) if typing.get_origin(annotation) is list else None
+            if allow_children and _is_model(item):
+                child = Table(f"{name}_{'_'.join(path)}", path)
+                child.columns = [(key, (key,), int if key == "ordinal" else str) for key in KEY_COLUMNS]
+                walk(item, child, (), False)
+                tables.append(child)
+                continue
+            table.columns.append(("_".join(path), path, _scalar_type(annotation)))
+
+    walk(model, parent, (), True)
+    return tables
+
+
+def _get(obj, path):
+    for name in path:
+        if obj is None:
+            return None
+        obj = getattr(obj, name, None)
+    return obj
+
+
+def _cell(value, column_type):
+    if value is None:
+        return None
+    if column_type is None:
+        return json.dumps(to_jsonable_python(value))
+    if isinstance(value, Enum):
+        return value.value
+    if column_type is datetime and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    if column_type in (bool, int, float, date, datetime):
+        return value
+    return str(value)
+
+
+def rows(table, record):
+    """Yield the rows of table contributed by one record."""
+    if not table.path:
+        yield [_cell(_get(record, path), column_type) for _, path, column_type in table.columns]
+        return
+    for ordinal, item in enumerate(_get(record, table.path) or ()):
+        keys = {"usgsIdentifier": record.usgsIdentifier, "ordinal": ordinal}
+        yield [
+            keys[name] if name in keys else _cell(_get(item, path), column_type)
+            for name, path, column_type in table.columns
+        ]
+
+
+class _CsvWriter:
+    def __init__(self, path, table):
+        self._file = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(table.column_names)
+
+    def write(self, rows):
+        self._writer.writerows([v.isoformat() if isinstance(v, date) else v for v in row] for row in rows)
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path, table):
+        arrow_types = {
+            bool: pa.bool_(),
+            int: pa.int64(),
+            float: pa.float64(),
+            date: pa.date32(),
+            datetime: pa.timestamp("us"),
+        }
+        self._schema = pa.schema(
+            [(name, arrow_types.get(column_type, pa.string())) for name, _, column_type in table.columns]
+        )
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, rows):
+        columns = list(zip(*rows))
+        arrays = [pa.array(values, type=field.type) for values, field in zip(columns, self._schema)]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+class TabularExporter:
+    """Stream records into relational tables written as CSV or Parquet files.
+
+    Rows are buffered per table and written in row groups of row_group_size
+    rows, so memory use does not depend on the number of records exported.
+    Parquet output requires pyarrow.
+
+    Example
+    -------
+    exporter = TabularExporter(Dataset, "export/", format="parquet")
+    counts = exporter.export(records)
+    """
+
+    formats = {"csv": (".csv", _CsvWriter), "parquet": (".parquet", _ParquetWriter)}
+
+    def __init__(self, model, directory, format="csv", row_group_size=10_000):
+        if format not in self.formats:
+            raise ValueError(f"Unsupported format {format!r}; expected one of {sorted(self.formats)}")
+        if format == "parquet" and pa is None:
+            raise ImportError("pyarrow is required to export Parquet files")
+        self.model = model
+        self.directory = Path(directory)
+        self.format = format
+        self.row_group_size = row_group_size
+        self.tables = layout(model)
+
+    def export(self, records):
+        """Write records to one file per table and return the number of rows in each table."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        suffix, writer_class = self.formats[self.format]
+        writers = {table.name: writer_class(self.directory / f"{table.name}{suffix}", table) for table in self.tables}
+        buffers = {table.name: [] for table in self.tables}
+        counts = dict.fromkeys(buffers, 0)
+        try:
+            for record in records:
+                for table in self.tables:
+                    buffer = buffers[table.name]
+                    buffer.extend(rows(table, record))
+                    while len(buffer) >= self.row_group_size:
+                        writers[table.name].write(buffer[: self.row_group_size])
+                        counts[table.name] += self.row_group_size
+                        del buffer[: self.row_group_size]
+            for name, buffer in buffers.items():
+                if buffer:
+                    writers[name].write(buffer)
+                    counts[name] += len(buffer)
+        finally:
+            for writer in writers.values():
+                writer.close()
+        return counts
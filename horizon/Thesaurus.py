@@ -0,0 +1,155 @@
+import bisect
+import csv
+import json
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from .Dataset import Keyword
+
+# Parsed vocabulary files, by (path, modification time), so that each file is
+# read once per process.
+_vocabulary_files = {}
+
+
+class KeywordIssue(BaseModel):
+    """A keyword that does not agree with its controlled vocabulary.
+
+    Fields
+    ------
+    index: Position of the keyword in the list that was validated.
+    concept: The keyword or tag
+    conceptScheme: The name of the vocabulary the keyword claims to come from.
+    message: A description of the problem.
+    """
+
+    index: int
+    concept: str
+    conceptScheme: str
+    message: str
+
+
+class _Vocabulary:
+    """The concepts of one scheme, as a sorted array of case-folded labels for prefix search."""
+
+    def __init__(self, concepts):
+        entries = sorted((label.casefold(), label, uri) for label, uri in concepts)
+        self.keys = [key for key, _, _ in entries]
+        self.labels = [label for _, label, _ in entries]
+        self.uris = [uri for _, _, uri in entries]
+        self.exact = {key: i for i, key in enumerate(self.keys)}
+
+    def __len__(self):
+        return len(self.keys)
+
+
+def read_vocabulary(path):
+    """Read a vocabulary file and return (conceptScheme, [(concept, conceptUri), ...]).
+
+    JSON files hold {"conceptScheme": ..., "concepts": [{"concept": ...,
+    "conceptUri": ...}, ...]}. CSV files have concept and conceptUri columns
+    and take their conceptScheme from the file name.
+    """
+    path = Path(path).resolve()
+    key = (path, path.stat().st_mtime_ns)
+    if key not in _vocabulary_files:
+        if path.suffix == ".csv":
+            with open(path, newline="") as f:
+                concepts = [(row["concept"], row.get("conceptUri") or None) for row in csv.DictReader(f)]
+            _vocabulary_files[key] = (path.stem, concepts)
+        else:
+            document = json.loads(path.read_text())
+            concepts = [(c["concept"], c.get("conceptUri")) for c in document["concepts"]]
+            _vocabulary_files[key] = (document["conceptScheme"], concepts)
+    return _vocabulary_files[key]
+
+
+class Thesaurus:
+    """Local controlled vocabularies for validating and autocompleting Keywords.
+
+    Each conceptScheme (e.g., "USGS Thesaurus", "ISO 19115 Topic Category")
+    is held as a sorted array of labels, so a prefix lookup is a binary search
+    plus the number of suggestions returned. Matching is case-insensitive.
+    Keywords whose conceptScheme is not loaded are treated as free keywords
+    and are not validated.
+    """
+
+    def __init__(self):
+        self._schemes = {}
+
+    def __contains__(self, conceptScheme):
+        return conceptScheme in self._schemes
+
+    @property
+    def schemes(self):
+        return sorted(self._schemes)
+
+    def add_scheme(self, conceptScheme, concepts):
+        """Load a scheme from (concept, conceptUri) pairs, replacing any scheme of the same name."""
+        self._schemes[conceptScheme] = _Vocabulary(concepts)
+
+    def load(self, path, conceptScheme=None):
+        """Load a vocabulary file. See read_vocabulary for the supported formats."""
+        name, concepts = read_vocabulary(path)
+        self.add_scheme(conceptScheme or name, concepts)
+
+    def complete(self, conceptScheme, prefix, limit=10):
+        """Return up to limit Keywords from conceptScheme whose concept starts with prefix."""
+        vocabulary = self._schemes[conceptScheme]
+        prefix = prefix.casefold()
+        start = bisect.bisect_left(vocabulary.keys, prefix)
+        suggestions = []
+        for i in range(start, min(start + limit, len(vocabulary))):
+            if not vocabulary.keys[i].startswith(prefix):
+                break
+            suggestions.append(
+                Keyword(concept=vocabulary.labels[i], conceptScheme=conceptScheme, conceptUri=vocabulary.uris[i])
+            )
+        return suggestions
+
+    def lookup(self, conceptScheme, concept):
+        """Return the conceptUri of a concept, or None if it has none. Raises KeyError if unknown."""
+        vocabulary = self._schemes[conceptScheme]
+        return vocabulary.uris[vocabulary.exact[concept.casefold()]]
+
+    def validate_keywords(self, keywords):
+        """Return a KeywordIssue for each keyword that is not in, or disagrees with, its scheme."""
+        issues = []
+        for index, keyword in enumerate(keywords or ()):
+            vocabulary = self._schemes.get(keyword.conceptScheme)
+            if vocabulary is None:
+                continue
+            i = vocabulary.exact.get(keyword.concept.casefold())
+            uri = str(keyword.conceptUri).rstrip("/") if keyword.conceptUri is not None else None
+            if i is None:
+                message = f"Not a concept in {keyword.conceptScheme!r}"
+            elif uri is not None and uri != str(vocabulary.uris[i]).rstrip("/"):
+                message = f"conceptUri does not match {vocabulary.uris[i]!r}"
+            else:
+                continue
+            issues.append(
+                KeywordIssue(
+                    index=index, concept=keyword.concept, conceptScheme=keyword.conceptScheme, message=message
+                )
+            )
+        return issues
+
+    def validate_catalog(self, records):
+        """Validate the keywords of every record. Returns issues by usgsIdentifier for records that have any."""
+        results = {}
+        for record in records:
+            issues = self.validate_keywords(getattr(record, "keyword", None))
+            if issues:
+                results[record.usgsIdentifier] = issues
+        return results
+
+    def with_uris(self, keywords):
+        """Return copies of keywords with conceptUri filled in from their schemes where it is missing."""
+        resolved = []
+        for keyword in keywords or ():
+            vocabulary = self._schemes.get(keyword.conceptScheme)
+            i = vocabulary.exact.get(keyword.concept.casefold()) if vocabulary is not None else None
+            if keyword.conceptUri is None and i is not None and vocabulary.uris[i] is not None:
+                keyword = Keyword.model_validate({**keyword.model_dump(), "conceptUri": vocabulary.uris[i]})
+            resolved.append(keyword)
+        return resolved
@@ -1,25 +1,15 @@
-import erdantic as erd
-import os
 from pathlib import Path
 
-cpath = Path.cwd().parents[0]
-npath = Path.joinpath(cpath, "datamodel/horizon/")
-os.chdir(npath)
+from horizon.SchemaExport import SchemaExporter, erd
 
-from horizon.CatalogedResource import CatalogedResource
-from horizon.Entity import Entity
-from horizon.DataRelease import DataRelease
-from horizon.License import License
-from horizon.Location import Location
-from horizon.Distribution import Distribution
-from horizon.Dataset import Dataset
+if erd is None:
+    raise SystemExit("erdantic is required to draw ER diagrams")
 
-os.chdir(Path.cwd())
+root = Path(__file__).resolve().parents[1]
+# Fingerprints are kept out of the tracked output directory (see .gitignore)
+MANIFEST_DIR = ".schema-cache"
 
-erd.draw(Entity, out="../diagrams/Entity-diagram.png")
-erd.draw(License, out="../diagrams/License-diagram.png")
-erd.draw(Location, out="../diagrams/Location-diagram.png")
-erd.draw(Dataset, out="../diagrams/Dataset-diagram.png")
-erd.draw(DataRelease, out="../diagrams/DataRelease-diagram.png")
-erd.draw(CatalogedResource, out="../diagrams/CatalogedResource-diagram.png")
-erd.draw(Distribution, out="../diagrams/Distribution-diagram.png")
\ No newline at end of file
+result = SchemaExporter(diagram_dir=root / "diagrams", manifest_dir=root / MANIFEST_DIR).export()
+for path in result["written"]:
+    print(f"wrote {path.relative_to(root)}")
+print(f"{len(result['skipped'])} diagrams unchanged")
@@ -1,10 +1,12 @@
-import os
-import json
 from pathlib import Path
-from horizon.CatalogedResource import *
 
-main_model_schema = CatalogedResource.model_json_schema()
-print(json.dumps(main_model_schema, indent=2))
+from horizon.SchemaExport import SchemaExporter
 
-with open("./output_formats/CatalogedResource.json", "w") as f:
-    f.write(json.dumps(main_model_schema, indent=2))
+root = Path(__file__).resolve().parents[1]
+# Fingerprints are kept out of the tracked output directory (see .gitignore)
+MANIFEST_DIR = ".schema-cache"
+
+result = SchemaExporter(schema_dir=root / "output_formats", manifest_dir=root / MANIFEST_DIR).export()
+for path in result["written"]:
+    print(f"wrote {path.relative_to(root)}")
+print(f"{len(result['skipped'])} schemas unchanged")
@@ -0,0 +1,40 @@
+from datetime import datetime as dt, date
+
+import pytest
+
+from horizon.DataRelease import DataRelease
+
+
+release_data = {
+    "usgsIdentifier": "1234ab",
+    "identifier": "https://doi.org/10.5066/P1234AB",
+    "title": "Streamflow measurements in the Upper Colorado River Basin",
+    "usgsAssetType": "Data",
+    "usgsCreated": dt(2024, 1, 2, 8, 30),
+    "usgsModified": dt(2024, 1, 2, 8, 30),
+    "description": "Discrete streamflow measurements collected at gaging stations.",
+    "accessRights": "Public",
+    "usgsCitation": "...",
+    "issued": date(2024, 1, 15),
+    "creator": [
+        {"name": "Serna, Brandon", "nameType": "USGS Personal", "position": 1},
+        {"name": "Langseth, Madison", "nameType": "USGS Personal", "position": 2},
+    ],
+    "contactPoint": {"name": "Serna, Brandon", "email": "bserna@usgs.gov"},
+    "usgsMetadataContactPoint": {"name": "Serna, Brandon"},
+    "usgsDataSource": {"name": "Science Analytics and Synthesis", "dataSourceId": "sas"},
+    "publisher": {"name": "U.S. Geological Survey", "nameType": "Organizational"},
+    "distribution": [],
+    "license": {"license": "Public Domain, CC0-1.0"},
+    "usgsApprovalIdentifier": "IP-000001",
+}
+
+
+@pytest.fixture
+def make_release():
+    """Build a valid DataRelease, overriding any of the default field values."""
+
+    def _make_release(**overrides):
+        return DataRelease(**{**release_data, **overrides})
+
+    return _make_release
@@ -0,0 +1,70 @@
+import pytest
+
+from horizon.CatalogIntegrity import CatalogIntegrityChecker
+from horizon.DataReleaseComponent import DataReleaseComponent, DataReleaseComponentForm
+
+
+def component(usgsIdentifier, isPartOf):
+    return DataReleaseComponent(
+        usgsIdentifier=usgsIdentifier,
+        isPartOf=isPartOf,
+        title="Component",
+        componentName="component",
+        description="...",
+    )
+
+
+def test_CatalogIntegrityChecker(make_release):
+    relation = {
+        "dataciteRelationType": "IsNewVersionOf",
+        "isPrimaryRelatedIdentifier": False,
+        "relatedIdentifierType": "DOI",
+    }
+    records = [
+        make_release(),
+        make_release(
+            usgsIdentifier="5678cd",
+            identifier="https://doi.org/10.5066/P5678CD",
+            relation=[
+                {**relation, "relatedIdentifier": "10.5066/p1234ab"},
+                {**relation, "relatedIdentifier": "https://doi.org/10.5066/missing"},
+            ],
+            creator=[
+                {"name": "Serna, Brandon", "position": 1, "entity_id": "e1"},
+                {"name": "Hsu, Leslie", "position": 3, "entity_id": "e1"},
+            ],
+        ),
+        component("c1", "1234ab"),
+        component("c2", "https://doi.org/10.5066/P5678CD"),
+        component("c3", "nope"),
+    ]
+
+    report = CatalogIntegrityChecker().check(records)
+    assert report.checked == 5
+    assert not report.ok
+    assert [v.usgsIdentifier for v in report.violations["isPartOf"]] == ["c3"]
+    assert [v.path for v in report.violations["relatedIdentifier"]] == ["relation[1].relatedIdentifier"]
+    assert [v.usgsIdentifier for v in report.violations["creatorPosition"]] == ["5678cd"]
+    assert len(report.violations["entityId"]) == 2
+
+    report = CatalogIntegrityChecker(known_identifiers=["10.5066/MISSING"]).check(records[:2])
+    assert "relatedIdentifier" not in report.violations
+
+
+def test_CatalogIntegrityChecker_isPartOf_forms(make_release):
+    records = [
+        make_release(),
+        component("c0", "10.5066/P1234AB"),
+        component("c1", "doi:10.5066/P1234AB"),
+        component("c2", "https://doi.org/10.5066/p1234ab"),
+        component("c3", "https://doi.org/10.5066/OTHER"),
+    ]
+    report = CatalogIntegrityChecker(rules=["isPartOf"]).check(records)
+    assert [v.usgsIdentifier for v in report.violations["isPartOf"]] == ["c3"]
+    assert "https://doi.org/10.5066/OTHER" in report.violations["isPartOf"][0].message
+
+
+def test_CatalogIntegrityChecker_rejects_form_records(make_release):
+    form = DataReleaseComponentForm(isPartOf="1234ab", title="Component", componentName="component", description="...")
+    with pytest.raises(TypeError):
+        CatalogIntegrityChecker().check([make_release(), form])
@@ -0,0 +1,57 @@
+from datetime import date
+
+from horizon.CatalogQuery import CatalogQuery, Eq, HasKeyword, Intersects, Range, Where
+from horizon.DataRelease import StatusEnum, UsgsReleaseTypeEnum
+
+
+def bbox(west, south, east, north):
+    return {"bbox": {
+        "westBoundLongitude": str(west),
+        "southBoundLatitude": str(south),
+        "eastBoundLongitude": str(east),
+        "northBoundLatitude": str(north),
+    }}
+
+
+def test_CatalogQuery(make_release):
+    streamflow = [{"concept": "Streamflow", "conceptScheme": "USGS Thesaurus"}]
+    records = [
+        make_release(usgsIdentifier="a", status="Published", usgsReleaseType="Dynamic",
+                     issued=date(2021, 5, 1), keyword=streamflow, spatial=bbox(-110, 36, -105, 41)),
+        make_release(usgsIdentifier="b", status="Published", usgsReleaseType="Dynamic",
+                     issued=date(2019, 5, 1), keyword=streamflow, spatial=bbox(-110, 36, -105, 41)),
+        make_release(usgsIdentifier="c", status="Published", usgsReleaseType="Dynamic",
+                     issued=date(2022, 5, 1), keyword=streamflow, spatial=bbox(170, -20, -170, -10)),
+        make_release(usgsIdentifier="d", status="Created", issued=date(2023, 1, 1), keyword=streamflow),
+    ]
+    query = CatalogQuery(records)
+
+    def ids(*predicates):
+        return [record.usgsIdentifier for record in query.filter(*predicates)]
+
+    published = Eq("status", StatusEnum.published)
+    dynamic = Eq("usgsReleaseType", UsgsReleaseTypeEnum.dynamic)
+    assert ids(published, dynamic, Range("issued", start=date(2020, 1, 1)), HasKeyword("streamflow")) == ["a", "c"]
+    assert ids(published, Intersects(-108, 30, -100, 50)) == ["a", "b"]
+    assert ids(Intersects(175, -15, 180, -12)) == ["c"]
+    assert ids(Range("usgsModified", end=date(2024, 1, 2))) == []
+    assert ids(Eq("status", "Deprecated")) == []
+    assert ids(Where(lambda r: r.usgsIdentifier > "b")) == ["c", "d"]
+    assert query.count() == 4
+
+    plan = query.explain(HasKeyword("streamflow"), Eq("status", "Created"), Where(bool))
+    assert [step.strategy for step in plan] == ["index", "scan", "scan"]
+    assert plan[0].estimate == 1
+
+
+def test_CatalogQuery_conceptScheme(make_release):
+    records = [
+        make_release(usgsIdentifier="a", keyword=[{"concept": "Streamflow", "conceptScheme": "USGS Thesaurus"}]),
+        make_release(usgsIdentifier="b", keyword=[{"concept": "streamflow", "conceptScheme": "GCMD"}]),
+        make_release(usgsIdentifier="c", keyword=[{"concept": "Geology", "conceptScheme": "USGS Thesaurus"}]),
+    ]
+    query = CatalogQuery(records)
+    predicate = HasKeyword("Streamflow", conceptScheme="USGS Thesaurus")
+    assert [step.strategy for step in query.explain(predicate)] == ["index"]
+    assert [record.usgsIdentifier for record in query.filter(predicate)] == ["a"]
+    assert query.count(HasKeyword("Streamflow", conceptScheme="ISO 19115")) == 0
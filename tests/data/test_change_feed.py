@@ -0,0 +1,70 @@
+from datetime import datetime as dt
+
+import pytest
+
+from horizon.ChangeFeed import ChangeFeed, encode_cursor
+
+
+def test_ChangeFeed_pages_after_cursor(make_release):
+    feed = ChangeFeed()
+    feed.record_many(
+        make_release(usgsIdentifier=f"r{i}", usgsModified=dt(2024, 1, i + 1))
+        for i in range(5)
+    )
+
+    page = feed.changes(limit=2)
+    assert [e.usgsIdentifier for e in page.entries] == ["r0", "r1"]
+    assert page.hasMore
+
+    # Updating a record moves it to the end of the feed
+    feed.record(make_release(usgsIdentifier="r0", usgsModified=dt(2024, 2, 1)))
+    page = feed.changes(page.cursor, limit=10)
+    assert [e.usgsIdentifier for e in page.entries] == ["r2", "r3", "r4", "r0"]
+    assert not page.hasMore
+    assert feed.changes(page.cursor).entries == []
+
+    with pytest.raises(ValueError):
+        feed.changes("not-a-cursor")
+
+
+def test_ChangeFeed_tombstones_and_persistence(make_release, tmp_path):
+    path = tmp_path / "feed.jsonl"
+    feed = ChangeFeed(path)
+    feed.record(make_release(usgsIdentifier="a", status="Published"))
+    feed.record(make_release(usgsIdentifier="a", status="Deprecated", usgsModified=dt(2024, 3, 1)))
+    feed.record(make_release(usgsIdentifier="b"))
+
+    reloaded = ChangeFeed(path)
+    assert len(reloaded) == 2
+    entries = {e.usgsIdentifier: e for e in reloaded.changes().entries}
+    assert entries["a"].deleted
+    assert not entries["b"].deleted
+
+    reloaded.compact()
+    assert len(path.read_text().splitlines()) == 2
+
+
+def test_ChangeFeed_ignores_stale_changes(make_release, tmp_path):
+    path = tmp_path / "feed.jsonl"
+    feed = ChangeFeed(path)
+    feed.record(make_release(usgsIdentifier="a", usgsModified=dt(2024, 3, 1), status="Published"))
+    cursor = feed.changes().cursor
+
+    entry = feed.record(make_release(usgsIdentifier="a", usgsModified=dt(2024, 2, 1)))
+    assert entry.usgsModified == dt(2024, 3, 1)
+    assert feed.changes(cursor).entries == []
+    assert len(path.read_text().splitlines()) == 1
+
+    # Out-of-order lines in the log are resolved the same way on load
+    with open(path, "a") as f:
+        f.write(entry.model_copy(update={"usgsModified": dt(2024, 1, 1)}).model_dump_json() + "\n")
+    assert ChangeFeed(path).changes().entries[0].usgsModified == dt(2024, 3, 1)
+
+
+def test_ChangeFeed_aware_cursor(make_release):
+    feed = ChangeFeed()
+    feed.record(make_release(usgsIdentifier="a", usgsModified=dt(2024, 3, 1, 12)))
+    cursor = encode_cursor((dt.fromisoformat("2024-03-01T06:00:00-07:00"), "0"))
+    assert [e.usgsIdentifier for e in feed.changes(cursor).entries] == []
+    cursor = encode_cursor((dt.fromisoformat("2024-03-01T04:00:00-07:00"), "0"))
+    assert [e.usgsIdentifier for e in feed.changes(cursor).entries] == ["a"]
@@ -0,0 +1,37 @@
+from horizon.Citation import CitationRenderer, CitationStyle, format_name
+
+
+def test_format_name():
+    assert format_name("Serna, Brandon Lee") == "Serna, B.L."
+    assert format_name("Jean-Luc  Picard", initials_separator=" ") == "Picard, J.-L."
+    assert format_name("U.S. Geological Survey", "Organizational") == "U.S. Geological Survey"
+
+
+def test_CitationRenderer(make_release):
+    release = make_release(
+        creator=[
+            {"name": "Langseth, Madison", "position": 2},
+            {"name": "Brandon Serna", "position": 1},
+            {"name": "Hsu, Leslie", "position": 3},
+        ]
+    )
+    renderer = CitationRenderer()
+    assert renderer.render(release) == (
+        "Serna, B., Langseth, M., and Hsu, L., 2024, "
+        "Streamflow measurements in the Upper Colorado River Basin: U.S. Geological Survey, "
+        "https://doi.org/10.5066/P1234AB."
+    )
+
+    cited = renderer.apply([release, make_release(usgsIdentifier="other", identifier=None)])
+    assert cited[0].usgsCitation == renderer.render(release)
+    assert cited[1].usgsCitation.endswith("U.S. Geological Survey.")
+    assert renderer.apply(cited)[0] is cited[0]
+
+    changed = cited[0].model_copy(update={"title": "Revised title"})
+    assert "Revised title" in renderer.render(changed)
+
+    renderer.style = CitationStyle("usgs", "{authors} ({year}) {title}")
+    assert renderer.render(changed).startswith("Serna, B., Langseth, M., and Hsu, L. (2024) Revised title")
+
+    apa = CitationRenderer("apa").render(release)
+    assert apa.startswith("Serna, B., Langseth, M., & Hsu, L. (2024).")
@@ -0,0 +1,44 @@
+import pytest
+
+from horizon.ColumnarCatalog import ColumnarCatalog
+from horizon.DataRelease import DataRelease
+from horizon.Dataset import Dataset
+
+
+def test_ColumnarCatalog_roundtrip(make_release):
+    releases = [
+        make_release(),
+        make_release(
+            usgsIdentifier="5678cd",
+            status="Published",
+            keyword=[{"concept": "streamflow", "conceptScheme": "USGS Thesaurus"}],
+            spatial={"bbox": {
+                "westBoundLongitude": "-110",
+                "eastBoundLongitude": "-105",
+                "southBoundLatitude": "36",
+                "northBoundLatitude": "41",
+            }},
+        ),
+        make_release(usgsIdentifier="9012ef", creator=[]),
+    ]
+    catalog = ColumnarCatalog.from_models(releases)
+
+    assert len(catalog) == 3
+    assert catalog.model is DataRelease
+    assert catalog.to_models() == releases
+    assert catalog.get("5678cd") == releases[1]
+    assert catalog[-1] == releases[2]
+    assert catalog.column("status") == ["Created", "Published", "Created"]
+    assert catalog.column("spatial.bbox.westBoundLongitude") == [None, "-110", None]
+
+    with pytest.raises(IndexError):
+        catalog[3]
+    with pytest.raises(KeyError):
+        catalog.column("creator")
+
+
+def test_ColumnarCatalog_rejects_mixed_types_and_duplicates(make_release):
+    with pytest.raises(TypeError):
+        ColumnarCatalog.from_models([make_release()], Dataset)
+    with pytest.raises(ValueError):
+        ColumnarCatalog.from_models([make_release(), make_release()])
@@ -0,0 +1,30 @@
+from horizon.Deduplication import DeduplicationIndex
+
+
+def test_DeduplicationIndex(make_release):
+    original = make_release(usgsIdentifier="a")
+    resubmitted = make_release(
+        usgsIdentifier="b",
+        title="Streamflow measurements in the Upper Colorado River Basin.",
+        creator=[
+            {"name": "Brandon Serna", "position": 1},
+            {"name": "Madison Langseth", "position": 2},
+        ],
+    )
+    unrelated = make_release(
+        usgsIdentifier="c",
+        title="Seismic hazard model for the conterminous United States",
+        description="Probabilistic ground motion estimates.",
+        creator=[{"name": "Hsu, Leslie", "position": 1}],
+    )
+
+    index = DeduplicationIndex()
+    index.add_many([original, unrelated])
+    assert [identifier for identifier, _ in index.candidates(resubmitted)] == ["a"]
+    assert index.candidates(unrelated) == []
+
+    index.add(resubmitted)
+    assert index.clusters() == [{"a", "b"}]
+
+    index.remove("b")
+    assert index.clusters() == []
@@ -0,0 +1,47 @@
+import pytest
+
+from horizon.EntityIndex import EntityIndex, normalize_name_identifier
+
+
+def test_normalize_name_identifier():
+    assert normalize_name_identifier("0000-0002-1825-009x") == "orcid:0000-0002-1825-009X"
+    assert normalize_name_identifier("https://orcid.org/0000-0002-1825-009X/") == "orcid:0000-0002-1825-009X"
+    assert normalize_name_identifier("https://ror.org/035A68863") == "ror:035a68863"
+    assert normalize_name_identifier("ror.org/035a68863") == "ror:035a68863"
+    assert normalize_name_identifier("035a68863") == "035a68863"
+    assert normalize_name_identifier("HTTPS://Example.org/People/1/") == "example.org/people/1"
+    assert normalize_name_identifier("  ") is None
+
+
+def test_EntityIndex(make_release):
+    orcid = "https://orcid.org/0000-0002-1825-0097"
+    usgs = "https://ror.org/035a68863"
+    index = EntityIndex([
+        make_release(
+            usgsIdentifier="a",
+            creator=[{"name": "Serna, Brandon", "position": 1, "nameIdentifier": orcid,
+                      "affiliationIdentifier": usgs}],
+            publisher={"name": "U.S. Geological Survey", "nameIdentifier": "ror.org/035a68863"},
+        ),
+        make_release(
+            usgsIdentifier="b",
+            qualifiedAttribution=[{"name": "Brandon Serna", "position": 1, "entity_id": "e1",
+                                   "nameIdentifier": "0000-0002-1825-0097", "contributorType": "Data Curator"}],
+        ),
+    ])
+
+    assert index.records(nameIdentifier="0000-0002-1825-0097") == ["a", "b"]
+    assert index.records(nameIdentifier=orcid, roles={"creator"}) == ["a"]
+    occurrence = index.occurrences(entity_id="e1")[0]
+    assert (occurrence.role, occurrence.contributorType.value) == ("qualifiedAttribution", "Data Curator")
+    assert index.records(nameIdentifier=usgs) == ["a"]
+    assert [o.name for o in index.affiliated("http://ror.org/035A68863/")] == ["Serna, Brandon"]
+
+    index.add(make_release(usgsIdentifier="a"))
+    assert index.records(nameIdentifier=orcid) == ["b"]
+    assert index.affiliated(usgs) == []
+    index.remove("b")
+    assert index.records(entity_id="e1") == []
+
+    with pytest.raises(ValueError):
+        index.records()
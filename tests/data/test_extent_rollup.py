@@ -0,0 +1,83 @@
+from datetime import date
+
+from horizon.DataReleaseComponent import DataReleaseComponent
+from horizon.ExtentRollup import ExtentRollup
+
+
+def component(usgsIdentifier, west, south, east, north, start=None, end=None, isPartOf="1234ab"):
+    return DataReleaseComponent(
+        usgsIdentifier=usgsIdentifier,
+        isPartOf=isPartOf,
+        title="Component",
+        componentName="component",
+        description="...",
+        spatial={"bbox": {
+            "westBoundLongitude": west,
+            "southBoundLatitude": south,
+            "eastBoundLongitude": east,
+            "northBoundLatitude": north,
+        }},
+        temporal={"startDate": start, "endDate": end},
+    )
+
+
+def bounds(location):
+    bbox = location.bbox
+    return (bbox.westBoundLongitude, bbox.southBoundLatitude, bbox.eastBoundLongitude, bbox.northBoundLatitude)
+
+
+def test_ExtentRollup(make_release):
+    rollup = ExtentRollup([
+        component("a", "-110.5", "36", "-105", "41", date(2001, 1, 1), date(2005, 1, 1)),
+        component("b", "-100", "30", "-95", "35", date(1999, 1, 1), date(2003, 1, 1)),
+    ])
+    assert bounds(rollup.spatial("1234ab")) == ("-110.5", "30", "-95", "41")
+    assert rollup.temporal("1234ab").startDate == date(1999, 1, 1)
+    assert rollup.temporal("1234ab").endDate == date(2005, 1, 1)
+
+    # Boxes on either side of the antimeridian roll up across it
+    rollup.upsert(component("c", "170", "-20", "-170", "-10", end=date(2010, 1, 1)))
+    rollup.upsert(component("d", "160", "-25", "175", "-15", isPartOf="other"))
+    rollup.upsert(component("e", "-175", "-25", "-160", "-15", isPartOf="other"))
+    assert bounds(rollup.spatial("other")) == ("160", "-25", "-160", "-15")
+    assert rollup.temporal("1234ab").startDate is None
+
+    rollup.remove("c")
+    rollup.upsert(component("b", "-100", "30", "-95", "35", isPartOf="other"))
+    assert bounds(rollup.spatial("1234ab")) == ("-110.5", "36", "-105", "41")
+    assert rollup.temporal("1234ab").startDate == date(2001, 1, 1)
+
+    release = rollup.apply(make_release())
+    assert bounds(release.spatial) == ("-110.5", "36", "-105", "41")
+    assert release.temporal.endDate == date(2005, 1, 1)
+
+    for usgsIdentifier in "abde":
+        rollup.remove(usgsIdentifier)
+    assert rollup.spatial("1234ab") is None
+    assert rollup.temporal("other") is None
+
+
+def test_ExtentRollup_unparseable_bbox():
+    rollup = ExtentRollup([
+        component("a", "-110", "36", "-105", "41"),
+        component("b", "N/A", "30", "", "35", date(1999, 1, 1)),
+    ])
+    assert bounds(rollup.spatial("1234ab")) == ("-110", "36", "-105", "41")
+    assert rollup.temporal("1234ab").startDate == date(1999, 1, 1)
+    rollup.remove("a")
+    assert rollup.spatial("1234ab") is None
+    rollup.remove("b")
+    assert rollup.temporal("1234ab") is None
+
+
+def test_ExtentRollup_isPartOf_forms(make_release):
+    rollup = ExtentRollup([
+        component("a", "-110", "36", "-105", "41", date(2001, 1, 1), date(2002, 1, 1), isPartOf="1234ab"),
+        component("b", "-100", "30", "-95", "35", isPartOf="10.5066/P1234AB"),
+        component("c", "-90", "25", "-85", "30", date(2003, 1, 1), date(2005, 1, 1), isPartOf="https://doi.org/10.5066/p1234ab"),
+    ])
+    assert bounds(rollup.spatial("doi:10.5066/P1234AB")) == ("-100", "25", "-85", "35")
+    release = rollup.apply(make_release())
+    assert bounds(release.spatial) == ("-110", "25", "-85", "41")
+    assert (release.temporal.startDate, release.temporal.endDate) == (date(2001, 1, 1), date(2005, 1, 1))
+    assert bounds(rollup.spatial("1234AB")) == ("-110", "36", "-105", "41")
@@ -0,0 +1,34 @@
+import pytest
+from pydantic import ValidationError
+
+from horizon.DataRelease import DataRelease
+from horizon.Instrumentation import Instrumentation
+
+
+def test_Instrumentation_disabled(make_release):
+    instrumentation = Instrumentation()
+    release = make_release()
+    assert instrumentation.validate_json(DataRelease, instrumentation.dump_json(release)) == release
+    assert instrumentation.render() == "\n"
+
+
+def test_Instrumentation_profile(make_release):
+    instrumentation = Instrumentation()
+    payload = make_release().model_dump_json()
+
+    with instrumentation.profile() as metrics:
+        instrumentation.validate_json(DataRelease, payload)
+        with pytest.raises(ValidationError):
+            instrumentation.validate(DataRelease, {"title": 1})
+        instrumentation.dump(make_release())
+    assert not instrumentation.enabled
+
+    text = metrics.render()
+    assert "# TYPE horizon_validation_seconds histogram" in text
+    assert 'horizon_validation_seconds_count{model="DataRelease",operation="validate_json"} 1' in text
+    assert 'horizon_validation_seconds_count{model="DataRelease",operation="validate"} 1' in text
+    assert 'horizon_field_validation_seconds_count{model="DataRelease",field="creator"} 1' in text
+    assert 'horizon_field_serialization_seconds_count{model="DataRelease",field="creator"} 1' in text
+    assert 'horizon_records_total{model="DataRelease",operation="validate",outcome="error"} 1' in text
+    assert 'horizon_validation_errors_total{model="DataRelease",field_path="title"} 1' in text
+    assert 'horizon_payload_bytes_bucket{model="DataRelease",operation="validate_json",le="+Inf"} 1' in text
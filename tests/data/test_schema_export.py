@@ -0,0 +1,45 @@
+from horizon.Dataset import Dataset
+from horizon.Location import Location
+from horizon.SchemaExport import SchemaExporter, SchemaRegistry, discover_models
+
+
+def test_discover_models():
+    models = discover_models()
+    assert models["Dataset"] is Dataset
+    assert "ChangeFeed" not in models
+
+
+def test_SchemaExporter_skips_unchanged(tmp_path):
+    exporter = SchemaExporter(schema_dir=tmp_path, models={"Dataset": Dataset, "Location": Location})
+    result = exporter.export()
+    assert len(result["written"]) == 2
+    assert (tmp_path / "Dataset.json").exists()
+
+    result = exporter.export()
+    assert result["written"] == []
+    assert len(result["skipped"]) == 2
+
+    (tmp_path / "Location.json").unlink()
+    assert exporter.export()["written"] == [tmp_path / "Location.json"]
+
+
+def test_SchemaRegistry_resolve():
+    registry = SchemaRegistry.from_models({"Dataset": Dataset})
+    keyword = registry.resolve("Dataset.json#/$defs/Keyword")
+    assert "concept" in keyword["properties"]
+    assert registry.resolve("#/$defs/Keyword", base="Dataset") is keyword
+
+
+def test_SchemaExporter_manifest_dir(tmp_path):
+    exporter = SchemaExporter(
+        schema_dir=tmp_path / "schemas", models={"Location": Location}, manifest_dir=tmp_path / "cache"
+    )
+    assert len(exporter.export()["written"]) == 1
+    assert sorted(path.name for path in (tmp_path / "schemas").iterdir()) == ["Location.json"]
+    assert (tmp_path / "cache" / "schemas.fingerprints.json").exists()
+    assert exporter.export()["written"] == []
+
+
+def test_SchemaRegistry_from_directory(tmp_path):
+    SchemaExporter(schema_dir=tmp_path, models={"Location": Location}).export()
+    assert list(SchemaRegistry.from_directory(tmp_path)) == ["Location"]
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from horizon.Location import Location
+from horizon.SchemaMigration import BulkMigrator, MigrationRegistry, SCHEMA_VERSION_KEY
+
+
+def make_registry():
+    registry = MigrationRegistry()
+
+    @registry.register(Location, from_version=1)
+    def add_centroid(document):
+        return {**document, "centroid": {"pointLongitude": "0", "pointLatitude": "0"}}
+
+    @registry.register(Location, from_version=2)
+    def drop_bbox(document):
+        return {k: v for k, v in document.items() if k != "bbox"}
+
+    return registry
+
+
+def test_MigrationRegistry_lazy_load():
+    registry = make_registry()
+    assert registry.current_version(Location) == 3
+
+    document = {"bbox": None}
+    location = registry.load(document, Location)
+    assert location.centroid.pointLongitude == "0"
+    assert document == {"bbox": None}
+    assert registry.dump(location)[SCHEMA_VERSION_KEY] == 3
+
+    with pytest.raises(ValueError):
+        registry.migrate({SCHEMA_VERSION_KEY: 4}, Location)
+
+
+def test_BulkMigrator_resumes(tmp_path):
+    registry = make_registry()
+    for i in range(4):
+        (tmp_path / f"{i}.json").write_text(json.dumps({}))
+    (tmp_path / "bad.json").write_text(json.dumps({SCHEMA_VERSION_KEY: 9}))
+
+    result = BulkMigrator(Location, tmp_path, registry=registry, max_workers=2).run()
+    assert (result.migrated, result.skipped, len(result.failed)) == (4, 0, 1)
+    assert result.complete
+    assert json.loads((tmp_path / "0.json").read_text())[SCHEMA_VERSION_KEY] == 3
+
+    result = BulkMigrator(Location, tmp_path, registry=registry).run()
+    assert (result.migrated, result.skipped, len(result.failed)) == (0, 4, 1)
@@ -0,0 +1,30 @@
+from horizon.DataRelease import StatusEnum
+from horizon.Entity import Entity
+from horizon.StatusWorkflow import StatusWorkflow, TransitionLog
+
+
+def test_StatusWorkflow(make_release, tmp_path):
+    log = TransitionLog(tmp_path / "transitions.jsonl")
+    workflow = StatusWorkflow(log)
+    curator = Entity(name="Hsu, Leslie")
+    submitted = [make_release(usgsIdentifier=f"r{i}", status="Submitted") for i in range(3)]
+
+    result = workflow.transition(submitted + [make_release(usgsIdentifier="x")], StatusEnum.published)
+    assert result.records == []
+    assert [r.usgsIdentifier for r in result.rejected] == ["x"]
+    assert list(log) == []
+
+    result = workflow.transition(submitted, "Published", usgsModifiedBy=curator)
+    assert [r.status for r in result.records] == [StatusEnum.published] * 3
+    assert result.records[0].usgsModifiedBy == curator
+    assert result.records[0].usgsModified > submitted[0].usgsModified
+    assert submitted[0].status == "Submitted"
+
+    result = workflow.transition(result.records + [make_release(usgsIdentifier="x")], "Deprecated", atomic=False)
+    assert len(result.applied) == 3
+    assert len(result.rejected) == 1
+
+    entries = list(log)
+    assert len(entries) == 6
+    assert len({entry.batchId for entry in entries}) == 2
+    assert entries[-1].fromStatus == StatusEnum.published
@@ -0,0 +1,45 @@
+import csv
+
+import pytest
+
+from horizon.DataRelease import DataRelease
+from horizon.TabularExport import TabularExporter, layout
+
+
+def test_layout():
+    tables = {table.name: table for table in layout(DataRelease)}
+    assert "spatial_bbox_westBoundLongitude" in tables["DataRelease"].column_names
+    assert "license_license" in tables["DataRelease"].column_names
+    assert tables["DataRelease_creator"].column_names[:3] == ["usgsIdentifier", "ordinal", "entity_id"]
+    assert "checksum_algorithm" in tables["DataRelease_distribution"].column_names
+
+
+def test_TabularExporter_csv(make_release, tmp_path):
+    records = (make_release(usgsIdentifier=f"r{i}") for i in range(5))
+    counts = TabularExporter(DataRelease, tmp_path, row_group_size=2).export(records)
+    assert counts["DataRelease"] == 5
+    assert counts["DataRelease_creator"] == 10
+    assert counts["DataRelease_keyword"] == 0
+
+    with open(tmp_path / "DataRelease_creator.csv") as f:
+        creators = list(csv.DictReader(f))
+    assert creators[3]["usgsIdentifier"] == "r1"
+    assert creators[3]["name"] == "Langseth, Madison"
+    with open(tmp_path / "DataRelease.csv") as f:
+        release = next(csv.DictReader(f))
+    assert release["issued"] == "2024-01-15"
+    assert release["status"] == "Created"
+
+    with pytest.raises(ValueError):
+        TabularExporter(DataRelease, tmp_path, format="xlsx")
+
+
+def test_TabularExporter_parquet(make_release, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    records = (make_release(usgsIdentifier=f"r{i}") for i in range(5))
+    TabularExporter(DataRelease, tmp_path, format="parquet", row_group_size=2).export(records)
+
+    parquet = pq.ParquetFile(tmp_path / "DataRelease.parquet")
+    assert parquet.metadata.num_rows == 5
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.read().column("usgsIdentifier").to_pylist() == [f"r{i}" for i in range(5)]
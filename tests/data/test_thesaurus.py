@@ -0,0 +1,41 @@
+import json
+
+from horizon.Dataset import Keyword
+from horizon.Thesaurus import Thesaurus
+
+
+def test_Thesaurus(make_release, tmp_path):
+    path = tmp_path / "usgs.json"
+    path.write_text(json.dumps({
+        "conceptScheme": "USGS Thesaurus",
+        "concepts": [
+            {"concept": "streamflow", "conceptUri": "https://apps.usgs.gov/thesaurus/term/1"},
+            {"concept": "stream gaging", "conceptUri": "https://apps.usgs.gov/thesaurus/term/2"},
+            {"concept": "sediment", "conceptUri": "https://apps.usgs.gov/thesaurus/term/3"},
+        ],
+    }))
+    (tmp_path / "ISO 19115 Topic Category.csv").write_text("concept,conceptUri\ninlandWaters,\n")
+
+    thesaurus = Thesaurus()
+    thesaurus.load(path)
+    thesaurus.load(tmp_path / "ISO 19115 Topic Category.csv")
+    assert thesaurus.schemes == ["ISO 19115 Topic Category", "USGS Thesaurus"]
+
+    assert [k.concept for k in thesaurus.complete("USGS Thesaurus", "Str")] == ["stream gaging", "streamflow"]
+    assert [k.concept for k in thesaurus.complete("USGS Thesaurus", "s", limit=1)] == ["sediment"]
+    assert thesaurus.complete("USGS Thesaurus", "x") == []
+    assert thesaurus.lookup("ISO 19115 Topic Category", "inlandwaters") is None
+
+    keywords = [
+        Keyword(concept="Streamflow", conceptScheme="USGS Thesaurus"),
+        Keyword(concept="rivers", conceptScheme="USGS Thesaurus"),
+        Keyword(concept="sediment", conceptScheme="USGS Thesaurus", conceptUri="https://example.com/x"),
+        Keyword(concept="anything", conceptScheme="Project keywords"),
+    ]
+    issues = thesaurus.validate_catalog([make_release(keyword=keywords), make_release(usgsIdentifier="ok")])
+    assert list(issues) == ["1234ab"]
+    assert [issue.index for issue in issues["1234ab"]] == [1, 2]
+
+    resolved = thesaurus.with_uris(keywords)
+    assert str(resolved[0].conceptUri) == "https://apps.usgs.gov/thesaurus/term/1"
+    assert resolved[1].conceptUri is None